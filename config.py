@@ -4,7 +4,31 @@ Configuration file for EEG-Drone Control System
 Adjust these parameters to tune the system behavior
 """
 
+import platform
+from dataclasses import dataclass, field
+
+
+def _default_eeg_port():
+    """Pick the platform-appropriate serial port for the MindWave headset"""
+    system = platform.system()
+    if system == 'Windows':
+        # Windows typically uses COM ports for Bluetooth serial
+        # You may need to adjust this to match your system
+        return 'COM3'
+    if system == 'Darwin':
+        # macOS Bluetooth serial port
+        return '/dev/tty.MindWaveMobile-SerialPo'
+    # Linux typically uses /dev/rfcomm0
+    # You need to pair and bind the device first:
+    # sudo bluetoothctl
+    # pair XX:XX:XX:XX:XX:XX
+    # sudo rfcomm bind /dev/rfcomm0 XX:XX:XX:XX:XX:XX
+    return '/dev/rfcomm0'
+
 
+# frozen only: slots=True needs Python 3.10, and the Pi OS Bullseye
+# target ships 3.9 - the attribute-read win isn't worth losing it
+@dataclass(frozen=True, repr=False)
 class Config:
     """Configuration parameters for the EEG-controlled Tello drone system"""
 
@@ -12,108 +36,110 @@ class Config:
     # MindWave Mobile 2 Bluetooth connection
     # For Linux: typically '/dev/rfcomm0' (use rfcomm bind)
     # For Windows: typically 'COM3', 'COM4', etc.
-    EEG_PORT = '/dev/rfcomm0'
-    EEG_BAUDRATE = 57600  # Standard for MindWave
+    EEG_PORT: str = field(default_factory=_default_eeg_port)
+    EEG_BAUDRATE: int = 57600  # Standard for MindWave
 
     # ========== Tello Drone Configuration ==========
     # Default Tello WiFi settings
-    TELLO_IP = '192.168.10.1'
-    TELLO_PORT = 8889
-    TELLO_STATE_PORT = 8890
-    TELLO_VIDEO_PORT = 11111
+    TELLO_IP: str = '192.168.10.1'
+    TELLO_PORT: int = 8889
+    TELLO_STATE_PORT: int = 8890
+    TELLO_VIDEO_PORT: int = 11111
 
     # Safety settings
-    MIN_BATTERY_LEVEL = 20  # Don't fly if battery below this percentage
-    AUTO_TAKEOFF = True  # Set to True to automatically takeoff on start
+    MIN_BATTERY_LEVEL: int = 20  # Don't fly if battery below this percentage
+    AUTO_TAKEOFF: bool = True  # Set to True to automatically takeoff on start
 
     # ========== Web Visualization Server ==========
     # Enable web dashboard for real-time EEG visualization
-    ENABLE_WEB_SERVER = True  # Set to False to disable web server
-    WEB_HOST = '0.0.0.0'  # Listen on all network interfaces
-    WEB_PORT = 5000  # Web server port
-    WEB_UPDATE_RATE = 10  # Data updates per second (Hz)
+    ENABLE_WEB_SERVER: bool = True  # Set to False to disable web server
+    WEB_HOST: str = '0.0.0.0'  # Listen on all network interfaces
+    WEB_PORT: int = 5000  # Web server port
+    WEB_UPDATE_RATE: int = 10  # Data updates per second (Hz)
+    WEB_BATCH_SIZE: int = 5  # Samples per SocketIO broadcast (1 = emit every sample)
 
     # ========== Alpha Wave Mapping Configuration ==========
     # Alpha power ranges (adjust based on your headset readings)
     # These values are typical for MindWave Mobile 2
-    ALPHA_MIN = 0  # Minimum alpha power
-    ALPHA_MAX = 1000000  # Maximum alpha power (adjust after testing)
+    ALPHA_MIN: int = 0  # Minimum alpha power
+    ALPHA_MAX: int = 1000000  # Maximum alpha power (adjust after testing)
 
     # ========== Cylindrical Coordinate Ranges ==========
     # r (radius) - controls forward/backward movement
-    R_MIN = 0  # Minimum radius
-    R_MAX = 100  # Maximum radius
-    R_DEADZONE = 5  # Reduced deadzone for more responsive control
+    R_MIN: int = 0  # Minimum radius
+    R_MAX: int = 100  # Maximum radius
+    R_DEADZONE: int = 5  # Reduced deadzone for more responsive control
 
     # theta (angle) - controls rotation/yaw
-    THETA_MIN = -180  # Minimum angle (degrees)
-    THETA_MAX = 180  # Maximum angle (degrees)
-    THETA_DEADZONE = 10  # Reduced deadzone for more responsive control
+    THETA_MIN: int = -180  # Minimum angle (degrees)
+    THETA_MAX: int = 180  # Maximum angle (degrees)
+    THETA_DEADZONE: int = 10  # Reduced deadzone for more responsive control
 
     # z (height) - controls up/down movement
-    Z_MIN = 0  # Minimum height
-    Z_MAX = 100  # Maximum height
-    Z_DEADZONE = 5  # Reduced deadzone for more responsive control
+    Z_MIN: int = 0  # Minimum height
+    Z_MAX: int = 100  # Maximum height
+    Z_DEADZONE: int = 5  # Reduced deadzone for more responsive control
 
     # ========== Velocity Mapping ==========
     # These control how aggressive the drone movements are
     # Velocity range for Tello is -100 to 100
-    VELOCITY_SCALE = 1.0  # Global velocity scaling (0.0 to 1.0)
+    VELOCITY_SCALE: float = 1.0  # Global velocity scaling (0.0 to 1.0)
 
     # ========== Signal Processing ==========
     # Smoothing factor for EEG data (0-1)
     # Higher = more smoothing (slower response, less jitter)
     # Lower = less smoothing (faster response, more jitter)
-    SMOOTHING_FACTOR = 0.7
+    SMOOTHING_FACTOR: float = 0.7
 
     # ========== Control Loop Settings ==========
     # How often to send commands to the drone (seconds)
-    COMMAND_INTERVAL = 0.05  # 20 Hz (Tello can handle up to 20 commands/sec)
+    COMMAND_INTERVAL: float = 0.05  # 20 Hz (Tello can handle up to 20 commands/sec)
 
     # Main loop delay (seconds)
-    LOOP_DELAY = 0.05  # 20 Hz
+    LOOP_DELAY: float = 0.05  # 20 Hz
 
     # ========== Signal Quality ==========
     # Minimum signal quality threshold (0 = best, 200 = no contact)
-    MAX_POOR_SIGNAL = 50  # Warn if signal quality above this
+    MAX_POOR_SIGNAL: int = 50  # Warn if signal quality above this
 
     # ========== Logging ==========
-    LOG_LEVEL = 'INFO'  # DEBUG, INFO, WARNING, ERROR, CRITICAL
-    LOG_FILE = 'eeg_drone_control.log'
+    LOG_LEVEL: str = 'INFO'  # DEBUG, INFO, WARNING, ERROR, CRITICAL
+    LOG_FILE: str = 'eeg_drone_control.log'
 
     # ========== Advanced Mapping Options ==========
     # Control mode: how EEG metrics map to coordinates
     # Mode 1: Alpha -> r, Attention -> theta, Meditation -> z (default)
     # Mode 2: Alpha -> z, Attention -> r, Meditation -> theta
     # Mode 3: Custom mapping (modify coordinate_mapper.py)
-    CONTROL_MODE = 1  # Back to Mode 1 for better blinking response
+    CONTROL_MODE: int = 1  # Back to Mode 1 for better blinking response
 
     # Enable/disable specific degrees of freedom
-    ENABLE_R_CONTROL = True  # Forward/backward
-    ENABLE_THETA_CONTROL = True  # Rotation
-    ENABLE_Z_CONTROL = True  # Up/down
+    ENABLE_R_CONTROL: bool = True  # Forward/backward
+    ENABLE_THETA_CONTROL: bool = True  # Rotation
+    ENABLE_Z_CONTROL: bool = True  # Up/down
 
     # ========== Safety Limits ==========
     # Maximum flight height (cm)
-    MAX_HEIGHT = 300  # 3 meters
+    MAX_HEIGHT: int = 300  # 3 meters
 
     # Maximum horizontal distance from takeoff point (cm)
-    MAX_HORIZONTAL_DISTANCE = 500  # 5 meters
+    MAX_HORIZONTAL_DISTANCE: int = 500  # 5 meters
 
     # Auto-land if signal quality is poor for this many seconds
-    AUTO_LAND_ON_POOR_SIGNAL_TIMEOUT = 10
+    AUTO_LAND_ON_POOR_SIGNAL_TIMEOUT: int = 10
 
     # ========== Calibration Settings ==========
     # Calibration mode: run for a few seconds to determine user's baseline
-    ENABLE_CALIBRATION = False
-    CALIBRATION_DURATION = 30  # seconds
+    ENABLE_CALIBRATION: bool = False
+    CALIBRATION_DURATION: int = 30  # seconds
 
-    def __init__(self):
-        """Initialize configuration with any runtime adjustments"""
-        pass
+    # Cached __repr__ output; safe to memoize because the config is frozen
+    _repr_cache: str = field(default='', init=False, repr=False, compare=False)
 
     def __repr__(self):
-        """String representation of configuration"""
+        """String representation of configuration (built once, then cached)"""
+        if self._repr_cache:
+            return self._repr_cache
         config_str = "EEG-Drone Control Configuration:\n"
         config_str += f"  EEG Port: {self.EEG_PORT}\n"
         config_str += f"  Tello IP: {self.TELLO_IP}\n"
@@ -124,30 +150,11 @@ class Config:
         config_str += f"  Alpha Range: {self.ALPHA_MIN} - {self.ALPHA_MAX}\n"
         config_str += f"  Smoothing Factor: {self.SMOOTHING_FACTOR}\n"
         config_str += f"  Command Interval: {self.COMMAND_INTERVAL}s\n"
+        # Bypass the frozen-dataclass guard to store the cache
+        object.__setattr__(self, '_repr_cache', config_str)
         return config_str
 
 
-# Platform-specific configuration overrides
-import platform
-
-if platform.system() == 'Windows':
-    # Windows typically uses COM ports for Bluetooth serial
-    # You may need to adjust this to match your system
-    Config.EEG_PORT = 'COM3'  # Change to your Bluetooth COM port
-
-elif platform.system() == 'Darwin':  # macOS
-    # macOS Bluetooth serial port
-    Config.EEG_PORT = '/dev/tty.MindWaveMobile-SerialPo'
-
-else:  # Linux
-    # Linux typically uses /dev/rfcomm0
-    # You need to pair and bind the device first:
-    # sudo bluetoothctl
-    # pair XX:XX:XX:XX:XX:XX
-    # sudo rfcomm bind /dev/rfcomm0 XX:XX:XX:XX:XX:XX
-    Config.EEG_PORT = '/dev/rfcomm0'
-
-
 if __name__ == "__main__":
     # Display configuration
     config = Config()
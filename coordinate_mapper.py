@@ -7,9 +7,72 @@ and converts them to drone velocity commands
 
 import math
 import logging
+from array import array
+
+try:
+    # Numba is optional: when installed the hot math kernels below are
+    # JIT-compiled, otherwise they run as plain Python functions
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 logger = logging.getLogger(__name__)
 
+# Bound at module load so the per-call trig path skips the math-module
+# attribute lookups, and the clamps skip the builtins lookup
+_sin = math.sin
+_cos = math.cos
+_min = min
+_max = max
+
+# Degrees-to-radians factor, so the conversion is a plain multiply
+_DEG2RAD = math.pi / 180.0
+
+
+@njit(cache=True)
+def _smooth_normalize_kernel(alpha_power, attention, meditation,
+                             alpha_smoothed, attention_smoothed, meditation_smoothed,
+                             inv_sf, alpha_min, alpha_inv_range,
+                             attention_min, attention_inv_range,
+                             meditation_min, meditation_inv_range):
+    """Fused EMA + normalization for the three EEG channels"""
+    alpha_smoothed += inv_sf * (alpha_power - alpha_smoothed)
+    attention_smoothed += inv_sf * (attention - attention_smoothed)
+    meditation_smoothed += inv_sf * (meditation - meditation_smoothed)
+
+    alpha_norm = (alpha_smoothed - alpha_min) * alpha_inv_range
+    alpha_norm = _max(0.0, _min(1.0, alpha_norm))
+    attention_norm = (attention_smoothed - attention_min) * attention_inv_range
+    attention_norm = _max(0.0, _min(1.0, attention_norm))
+    meditation_norm = (meditation_smoothed - meditation_min) * meditation_inv_range
+    meditation_norm = _max(0.0, _min(1.0, meditation_norm))
+
+    return (alpha_smoothed, attention_smoothed, meditation_smoothed,
+            alpha_norm, attention_norm, meditation_norm)
+
+
+@njit(cache=True)
+def _cylindrical_to_velocity_kernel(r, theta, z,
+                                    r_center, r_vel_scale,
+                                    theta_yaw_scale, theta_lat_scale,
+                                    z_center, z_vel_scale,
+                                    velocity_min, velocity_max):
+    """Cylindrical (r, theta, z) to (vx, vy, vz, vyaw) velocity conversion"""
+    vy = int((r - r_center) * r_vel_scale)
+    vyaw = int(theta * theta_yaw_scale)
+    vz = int((z - z_center) * z_vel_scale)
+    vx = int(theta * theta_lat_scale)
+
+    vx = _max(velocity_min, _min(velocity_max, vx))
+    vy = _max(velocity_min, _min(velocity_max, vy))
+    vz = _max(velocity_min, _min(velocity_max, vz))
+    vyaw = _max(velocity_min, _min(velocity_max, vyaw))
+
+    return vx, vy, vz, vyaw
+
 
 class CylindricalCoordinateMapper:
     """
@@ -45,11 +108,21 @@ class CylindricalCoordinateMapper:
         self.meditation_min = 0
         self.meditation_max = 100
 
-        # Blinking detection
-        self.alpha_history = []  # Store last 10 alpha values
+        # Blinking detection: last 10 alpha values in a fixed-size ring
+        # buffer (head index wraps, oldest value is overwritten in place).
+        # Backed by a typed array: alpha powers are 24-bit integers, so a
+        # compact machine-int buffer avoids boxing them as list elements
+        self.alpha_history = array('q', [0] * 10)
+        self._alpha_history_head = 0
+        self._alpha_history_len = 0
         self.blink_threshold = 300000  # Alpha spike threshold for blink detection
         self.normal_alpha_range = (100000, 200000)  # Normal alpha range
 
+        # Precomputed state table for branchless blink classification:
+        # index = (alpha >= low bound) + (alpha > blink threshold)
+        self._blink_states = ('low', 'normal', 'blink')
+        self._blink_low_bound = self.normal_alpha_range[0]
+
         # Cylindrical coordinate ranges
         self.r_min = config.R_MIN
         self.r_max = config.R_MAX
@@ -62,17 +135,45 @@ class CylindricalCoordinateMapper:
         self.velocity_min = -100
         self.velocity_max = 100
 
+        # Precomputed centers and scale coefficients for the velocity
+        # conversion. velocity_max is folded into the reciprocal ranges so
+        # each output is a single multiply-then-truncate
+        self.r_center = (self.r_min + self.r_max) / 2
+        self.r_vel_scale = self.velocity_max / (self.r_max - self.r_center)
+        self.theta_yaw_scale = self.velocity_max / self.theta_max
+        self.theta_lat_scale = self.theta_yaw_scale * 0.8  # Reduced sensitivity
+        self.z_center = (self.z_min + self.z_max) / 2
+        self.z_vel_scale = self.velocity_max / (self.z_max - self.z_center)
+
         # Smoothing filter (exponential moving average)
         self.alpha_smoothed = 0
         self.attention_smoothed = 0
         self.meditation_smoothed = 0
         self.smoothing_factor = config.SMOOTHING_FACTOR  # 0-1, higher = more smoothing
 
+        # Precomputed reciprocal ranges so the per-tick smoothing/normalization
+        # pass multiplies instead of dividing. A zero-width alpha range gets a
+        # zero factor, so the kernel pins alpha_norm to 0 (unlike normalize(),
+        # whose degenerate-range fallback is 0.5)
+        self.alpha_inv_range = (1.0 / (self.alpha_max - self.alpha_min)
+                                if self.alpha_max != self.alpha_min else 0.0)
+        self.attention_inv_range = 1.0 / (self.attention_max - self.attention_min)
+        self.meditation_inv_range = 1.0 / (self.meditation_max - self.meditation_min)
+
         # Dead zone thresholds (to prevent drift)
         self.r_deadzone = config.R_DEADZONE
         self.theta_deadzone = config.THETA_DEADZONE
         self.z_deadzone = config.Z_DEADZONE
 
+        # The control mode never changes at runtime, so resolve the
+        # coordinate mapping once instead of re-checking config every tick
+        if config.CONTROL_MODE == 1:
+            self._map_mode = self._map_mode1
+        elif config.CONTROL_MODE == 2:
+            self._map_mode = self._map_mode2
+        else:
+            self._map_mode = self._map_mode_default
+
         logger.info("Cylindrical coordinate mapper initialized")
 
     def normalize(self, value, min_val, max_val):
@@ -80,7 +181,7 @@ class CylindricalCoordinateMapper:
         if max_val == min_val:
             return 0.5
         normalized = (value - min_val) / (max_val - min_val)
-        return max(0, min(1, normalized))
+        return _max(0, _min(1, normalized))
 
     def map_to_range(self, normalized_value, out_min, out_max):
         """Map normalized value (0-1) to output range"""
@@ -88,14 +189,14 @@ class CylindricalCoordinateMapper:
 
     def smooth_value(self, new_value, smoothed_value):
         """Apply exponential moving average smoothing"""
-        return (self.smoothing_factor * smoothed_value +
-                (1 - self.smoothing_factor) * new_value)
+        return smoothed_value + (1 - self.smoothing_factor) * (new_value - smoothed_value)
 
     def apply_deadzone(self, value, center, deadzone):
         """Apply deadzone around center value"""
-        if abs(value - center) < deadzone:
-            return center
-        return value
+        # Branchless: the comparison is 0 inside the deadzone (offset is
+        # zeroed, returning center) and 1 outside (offset is kept)
+        offset = value - center
+        return center + offset * (abs(offset) >= deadzone)
 
     def map_alpha_to_coordinates(self, alpha_power, attention, meditation):
         """
@@ -109,42 +210,69 @@ class CylindricalCoordinateMapper:
         Returns:
             tuple: (r, theta, z) in cylindrical coordinates
         """
-        # Apply smoothing
-        self.alpha_smoothed = self.smooth_value(alpha_power, self.alpha_smoothed)
-        self.attention_smoothed = self.smooth_value(attention, self.attention_smoothed)
-        self.meditation_smoothed = self.smooth_value(meditation, self.meditation_smoothed)
-
-        # Normalize inputs
-        alpha_norm = self.normalize(self.alpha_smoothed, self.alpha_min, self.alpha_max)
-        attention_norm = self.normalize(self.attention_smoothed,
-                                       self.attention_min, self.attention_max)
-        meditation_norm = self.normalize(self.meditation_smoothed,
-                                        self.meditation_min, self.meditation_max)
-
-        # Map to cylindrical coordinates based on control mode
-        if self.config.CONTROL_MODE == 1:
-            # Mode 1: Alpha -> r (with blinking detection), Attention -> theta, Meditation -> z
-            # Use blinking detection for forward/backward movement
-            alpha_forward_backward = self.map_alpha_to_forward_backward(alpha_power)
-            r = self.map_to_range(alpha_forward_backward, self.r_min, self.r_max)
-            theta = self.map_to_range(attention_norm, self.theta_min, self.theta_max)
-            z = self.map_to_range(meditation_norm, self.z_min, self.z_max)
-        elif self.config.CONTROL_MODE == 2:
-            # Mode 2: Alpha -> z, Attention -> r, Meditation -> theta
-            r = self.map_to_range(attention_norm, self.r_min, self.r_max)
-            theta = self.map_to_range(meditation_norm, self.theta_min, self.theta_max)
-            z = self.map_to_range(alpha_norm, self.z_min, self.z_max)
-        else:
-            # Default to Mode 1
-            r = self.map_to_range(alpha_norm, self.r_min, self.r_max)
-            theta = self.map_to_range(attention_norm, self.theta_min, self.theta_max)
-            z = self.map_to_range(meditation_norm, self.z_min, self.z_max)
+        # Fused smoothing + normalization (JIT-compiled when Numba is present)
+        (self.alpha_smoothed, self.attention_smoothed, self.meditation_smoothed,
+         alpha_norm, attention_norm, meditation_norm) = _smooth_normalize_kernel(
+            alpha_power, attention, meditation,
+            self.alpha_smoothed, self.attention_smoothed, self.meditation_smoothed,
+            1.0 - self.smoothing_factor,
+            self.alpha_min, self.alpha_inv_range,
+            self.attention_min, self.attention_inv_range,
+            self.meditation_min, self.meditation_inv_range)
+
+        # Map to cylindrical coordinates (mapping resolved once in __init__)
+        r, theta, z = self._map_mode(alpha_power, alpha_norm,
+                                     attention_norm, meditation_norm)
 
         # Apply deadzones
-        r = self.apply_deadzone(r, (self.r_min + self.r_max) / 2, self.r_deadzone)
+        r = self.apply_deadzone(r, self.r_center, self.r_deadzone)
         theta = self.apply_deadzone(theta, 0, self.theta_deadzone)
-        z = self.apply_deadzone(z, (self.z_min + self.z_max) / 2, self.z_deadzone)
+        z = self.apply_deadzone(z, self.z_center, self.z_deadzone)
+
+        return r, theta, z
+
+    def map_alpha_to_coordinates_batch(self, alpha_powers, attentions, meditations):
+        """
+        Map a recorded sequence of EEG metrics to cylindrical coordinates
+
+        Runs the same stateful smoothing and mapping as the live path over a
+        whole recording, for offline replay and calibration sweeps. Call
+        reset_smoothing() first to replay from a clean filter state.
+
+        Args:
+            alpha_powers: Sequence of alpha wave power values
+            attentions: Sequence of attention levels (0-100)
+            meditations: Sequence of meditation levels (0-100)
+
+        Returns:
+            list: One (r, theta, z) tuple per input sample
+        """
+        map_one = self.map_alpha_to_coordinates
+        return [map_one(alpha, attention, meditation)
+                for alpha, attention, meditation
+                in zip(alpha_powers, attentions, meditations)]
+
+    def _map_mode1(self, alpha_power, alpha_norm, attention_norm, meditation_norm):
+        """Mode 1: Alpha -> r (with blinking detection), Attention -> theta, Meditation -> z"""
+        # Use blinking detection for forward/backward movement
+        alpha_forward_backward = self.map_alpha_to_forward_backward(alpha_power)
+        r = self.map_to_range(alpha_forward_backward, self.r_min, self.r_max)
+        theta = self.map_to_range(attention_norm, self.theta_min, self.theta_max)
+        z = self.map_to_range(meditation_norm, self.z_min, self.z_max)
+        return r, theta, z
+
+    def _map_mode2(self, alpha_power, alpha_norm, attention_norm, meditation_norm):
+        """Mode 2: Alpha -> z, Attention -> r, Meditation -> theta"""
+        r = self.map_to_range(attention_norm, self.r_min, self.r_max)
+        theta = self.map_to_range(meditation_norm, self.theta_min, self.theta_max)
+        z = self.map_to_range(alpha_norm, self.z_min, self.z_max)
+        return r, theta, z
 
+    def _map_mode_default(self, alpha_power, alpha_norm, attention_norm, meditation_norm):
+        """Fallback mapping: smoothed alpha -> r without blinking detection"""
+        r = self.map_to_range(alpha_norm, self.r_min, self.r_max)
+        theta = self.map_to_range(attention_norm, self.theta_min, self.theta_max)
+        z = self.map_to_range(meditation_norm, self.z_min, self.z_max)
         return r, theta, z
 
     def detect_blinking(self, alpha_power):
@@ -157,30 +285,20 @@ class CylindricalCoordinateMapper:
         Returns:
             str: 'blink', 'normal', or 'low'
         """
-        # Add current alpha to history
-        self.alpha_history.append(alpha_power)
-        
-        # Keep only last 10 values
-        if len(self.alpha_history) > 10:
-            self.alpha_history.pop(0)
-        
+        # Write current alpha into the ring buffer (typed array holds ints)
+        self.alpha_history[self._alpha_history_head] = int(alpha_power)
+        self._alpha_history_head = (self._alpha_history_head + 1) % 10
+        if self._alpha_history_len < 10:
+            self._alpha_history_len += 1
+
         # Need at least 3 values to detect patterns
-        if len(self.alpha_history) < 3:
-            return 'normal'
-        
-        # Check for blink (sudden spike)
-        if alpha_power > self.blink_threshold:
-            return 'blink'
-        
-        # Check if in normal range
-        if self.normal_alpha_range[0] <= alpha_power <= self.normal_alpha_range[1]:
+        if self._alpha_history_len < 3:
             return 'normal'
         
-        # Low alpha (below normal range)
-        if alpha_power < self.normal_alpha_range[0]:
-            return 'low'
-        
-        return 'normal'
+        # Branchless classification: below the low bound -> 'low', above the
+        # blink threshold -> 'blink', everything in between -> 'normal'
+        return self._blink_states[(alpha_power >= self._blink_low_bound) +
+                                  (alpha_power > self.blink_threshold)]
 
     def map_alpha_to_forward_backward(self, alpha_power):
         """
@@ -220,38 +338,16 @@ class CylindricalCoordinateMapper:
                    vz: up/down velocity (-100 to 100)
                    vyaw: yaw velocity (-100 to 100)
         """
-        # Convert theta to radians
-        theta_rad = math.radians(theta)
-
-        # r controls forward/backward movement (vy)
-        # Map r from (r_min, r_max) to velocity range
-        r_center = (self.r_min + self.r_max) / 2
-        r_normalized = (r - r_center) / (self.r_max - r_center)
-        vy = int(r_normalized * self.velocity_max)
-
-        # theta controls yaw rotation (vyaw)
-        # Normalize theta to -1 to 1 range
-        theta_normalized = theta / self.theta_max
-        vyaw = int(theta_normalized * self.velocity_max)
-
-        # z controls up/down movement (vz)
-        # Map z from (z_min, z_max) to velocity range
-        z_center = (self.z_min + self.z_max) / 2
-        z_normalized = (z - z_center) / (self.z_max - z_center)
-        vz = int(z_normalized * self.velocity_max)
-
-        # vx (left/right) - use theta for lateral movement
-        # Map theta to lateral movement for better control
-        vx = int(theta_normalized * self.velocity_max * 0.8)  # Reduced sensitivity
-
-        # Clamp all values to valid range
-        vx = max(self.velocity_min, min(self.velocity_max, vx))
-        vy = max(self.velocity_min, min(self.velocity_max, vy))
-        vz = max(self.velocity_min, min(self.velocity_max, vz))
-        vyaw = max(self.velocity_min, min(self.velocity_max, vyaw))
-
-        logger.debug(f"Cylindrical ({r:.1f}, {theta:.1f}°, {z:.1f}) -> "
-                    f"Velocity ({vx}, {vy}, {vz}, {vyaw})")
+        vx, vy, vz, vyaw = _cylindrical_to_velocity_kernel(
+            r, theta, z,
+            self.r_center, self.r_vel_scale,
+            self.theta_yaw_scale, self.theta_lat_scale,
+            self.z_center, self.z_vel_scale,
+            self.velocity_min, self.velocity_max)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Cylindrical (%.1f, %.1f°, %.1f) -> Velocity (%d, %d, %d, %d)",
+                         r, theta, z, vx, vy, vz, vyaw)
 
         return vx, vy, vz, vyaw
 
@@ -267,11 +363,30 @@ class CylindricalCoordinateMapper:
         Returns:
             tuple: (x, y, z) in Cartesian coordinates
         """
-        theta_rad = math.radians(theta)
-        x = r * math.cos(theta_rad)
-        y = r * math.sin(theta_rad)
+        theta_rad = theta * _DEG2RAD
+        x = r * _cos(theta_rad)
+        y = r * _sin(theta_rad)
         return x, y, z
 
+    def warmup(self):
+        """Exercise the math kernels once so JIT compilation happens now
+
+        When Numba is installed the first call to each @njit kernel pays
+        the compile cost; running a dummy sample here moves that pause to
+        initialization instead of the first control tick after takeoff.
+        Without Numba this is just a few arithmetic operations.
+        """
+        r, theta, z = self.map_alpha_to_coordinates(
+            (self.alpha_min + self.alpha_max) / 2, 50, 50)
+        self.cylindrical_to_velocity(r, theta, z)
+        # Discard the dummy sample's effect on the smoothing filters and
+        # the blink-detection history
+        self.alpha_smoothed = 0
+        self.attention_smoothed = 0
+        self.meditation_smoothed = 0
+        self._alpha_history_head = 0
+        self._alpha_history_len = 0
+
     def reset_smoothing(self):
         """Reset smoothing filters"""
         self.alpha_smoothed = 0
@@ -7,17 +7,39 @@ Handles Bluetooth connection and data parsing from NeuroSky MindWave headset
 import serial
 import struct
 import logging
-from threading import Thread, Lock
+from array import array
+from threading import Thread
+from typing import NamedTuple
 import time
 
 logger = logging.getLogger(__name__)
 
+# Precompiled once: raw EEG values are big-endian signed 16-bit
+_RAW_VALUE_STRUCT = struct.Struct('>h')
+
+# Bit offsets of the eight 3-byte EEG bands inside the 24-byte ASIC block
+# (delta first on the wire, so it sits in the highest bits)
+_BAND_SHIFTS = tuple(range(168, -1, -24))
+
+
+class EEGSample(NamedTuple):
+    """Control-loop view of one EEG snapshot
+
+    Carries just the fields the coordinate mapper consumes, with tuple
+    unpacking / attribute access instead of per-field dict lookups.
+    """
+    alpha: int
+    attention: int
+    meditation: int
+    signal_quality: int
+
 
 class MindWaveInterface:
     """Interface for MindWave Mobile 2 EEG headset via Bluetooth"""
 
     # ThinkGear packet constants
     SYNC = 0xAA
+    SYNC_BYTES = b'\xaa\xaa'
     EXCODE = 0x55
 
     # Data codes
@@ -27,6 +49,10 @@ class MindWaveInterface:
     CODE_RAW_VALUE = 0x80
     CODE_ASIC_EEG_POWER = 0x83
 
+    # Raw-sample ring size (power of two so the head wraps with a mask).
+    # 4096 samples at 512 Hz is an 8-second window
+    RAW_RING_SIZE = 4096
+
     def __init__(self, port='/dev/rfcomm0', baudrate=57600):
         """
         Initialize MindWave interface
@@ -41,7 +67,20 @@ class MindWaveInterface:
         self.is_connected = False
         self.is_reading = False
         self.read_thread = None
-        self.data_lock = Lock()
+
+        # Receive buffer: serial bytes are pulled in bulk and packets are
+        # scanned out of this buffer instead of one read() call per byte.
+        # The scratch chunk is preallocated and reused by readinto() so
+        # steady-state reads do not allocate
+        self._rx_buffer = bytearray()
+        self._read_chunk = bytearray(4096)
+        self._read_chunk_view = memoryview(self._read_chunk)
+
+        # Raw 512 Hz samples land in a preallocated int16 ring so downstream
+        # code can run an FFT over a recent window; the scalar in latest_data
+        # only ever holds the most recent sample
+        self._raw_ring = array('h', bytes(2 * self.RAW_RING_SIZE))
+        self._raw_head = 0
 
         # Latest EEG data
         self.latest_data = {
@@ -67,11 +106,23 @@ class MindWaveInterface:
         """Establish connection to MindWave headset"""
         try:
             logger.info(f"Connecting to MindWave on {self.port} at {self.baudrate} baud...")
+            # Non-blocking reads: _fill_rx_buffer drains in_waiting and the
+            # read loop paces itself, so no read ever parks the thread for
+            # the old 1-second timeout (shutdown joins promptly too)
             self.serial_conn = serial.Serial(
                 port=self.port,
                 baudrate=self.baudrate,
-                timeout=1
+                timeout=0
             )
+
+            # Request low-latency mode from the serial driver so packets are
+            # delivered as they arrive instead of being held in the adapter's
+            # buffer (supported on Linux; harmless to skip elsewhere)
+            try:
+                self.serial_conn.set_low_latency_mode(True)
+            except (AttributeError, NotImplementedError, ValueError) as e:
+                logger.debug(f"Low-latency mode not available: {e}")
+
             self.is_connected = True
             logger.info("MindWave connected successfully")
 
@@ -102,22 +153,33 @@ class MindWaveInterface:
 
     def _reset_data_on_poor_signal(self):
         """Reset EEG data to zero when signal quality is poor"""
-        with self.data_lock:
-            # Only reset if signal is very poor (>200 = headset off/not touching skin)
-            # But don't reset attention and meditation - they can still be valid
-            if self.latest_data['signal_quality'] > 200:
-                self.latest_data['delta'] = 0
-                self.latest_data['theta'] = 0
-                self.latest_data['low_alpha'] = 0
-                self.latest_data['high_alpha'] = 0
-                self.latest_data['alpha'] = 0
-                self.latest_data['low_beta'] = 0
-                self.latest_data['high_beta'] = 0
-                self.latest_data['low_gamma'] = 0
-                self.latest_data['mid_gamma'] = 0
+        # Only reset if signal is very poor (200 = headset off/not touching
+        # skin; the ThinkGear poor-signal byte never exceeds 200)
+        # But don't reset attention and meditation - they can still be valid
+        if self.latest_data['signal_quality'] >= 200:
+            self._publish({
+                'delta': 0,
+                'theta': 0,
+                'low_alpha': 0,
+                'high_alpha': 0,
+                'alpha': 0,
+                'low_beta': 0,
+                'high_beta': 0,
+                'low_gamma': 0,
+                'mid_gamma': 0,
                 # Don't reset attention and meditation - they might still be valid
-                # self.latest_data['attention'] = 0
-                # self.latest_data['meditation'] = 0
+            })
+
+    def _publish(self, updates):
+        """Publish parsed fields by swapping in a fresh snapshot dict
+
+        The read thread is the only writer; readers pick up the new dict via
+        a single (GIL-atomic) reference assignment, so no lock is needed and
+        a published snapshot is never mutated afterwards.
+        """
+        new_data = dict(self.latest_data)
+        new_data.update(updates)
+        self.latest_data = new_data
 
     def _read_loop(self):
         """Background thread for reading data from MindWave"""
@@ -166,147 +228,193 @@ class MindWaveInterface:
 
                 time.sleep(0.1)
 
+    def _fill_rx_buffer(self):
+        """Pull everything the serial driver has buffered into _rx_buffer"""
+        waiting = self.serial_conn.in_waiting or 1
+        view = self._read_chunk_view[:min(waiting, len(self._read_chunk))]
+        n = self.serial_conn.readinto(view)
+        if not n:
+            return False
+        self._rx_buffer.extend(view[:n])
+        return True
+
     def _read_packet(self):
         """Read a single ThinkGear packet"""
         if not self.serial_conn or not self.serial_conn.is_open:
             return None
 
         try:
-            # Wait for sync bytes (0xAA 0xAA)
+            buf = self._rx_buffer
             while True:
-                byte = self.serial_conn.read(1)
-                if not byte:
+                # Locate the sync bytes (0xAA 0xAA) in the buffered data
+                start = buf.find(self.SYNC_BYTES)
+                if start < 0:
+                    # Discard scanned bytes, keeping one in case it is the
+                    # first half of a sync pair split across reads
+                    del buf[:-1]
+                    if not self._fill_rx_buffer():
+                        return None
+                    continue
+
+                # Need at least the payload length byte after the sync pair
+                if len(buf) < start + 3:
+                    if not self._fill_rx_buffer():
+                        return None
+                    continue
+
+                # Payload length should be less than 170
+                plength = buf[start + 2]
+                if plength > 169:
+                    # Bogus header - resync just past this sync pair
+                    del buf[:start + 2]
+                    continue
+
+                # Wait for payload + checksum to arrive
+                end = start + 3 + plength + 1
+                while len(buf) < end:
+                    if not self._fill_rx_buffer():
+                        return None
+
+                payload = bytes(buf[start + 3:end - 1])
+                checksum = buf[end - 1]
+                del buf[:end]
+
+                # Verify checksum: one C-level sum over the bytes, inverted
+                # and masked in a single expression
+                if (~sum(payload)) & 0xFF != checksum:
+                    logger.warning("Checksum failed")
                     return None
 
-                if ord(byte) == self.SYNC:
-                    byte2 = self.serial_conn.read(1)
-                    if byte2 and ord(byte2) == self.SYNC:
-                        break
-
-            # Read payload length
-            plength_byte = self.serial_conn.read(1)
-            if not plength_byte:
-                return None
-
-            plength = ord(plength_byte)
-
-            # Payload length should be less than 170
-            if plength > 169:
-                return None
-
-            # Read payload
-            payload = self.serial_conn.read(plength)
-            if len(payload) != plength:
-                return None
-
-            # Read checksum
-            checksum_byte = self.serial_conn.read(1)
-            if not checksum_byte:
-                return None
-
-            checksum = ord(checksum_byte)
-
-            # Verify checksum
-            payload_sum = sum(payload) & 0xFF
-            if ((~payload_sum) & 0xFF) != checksum:
-                logger.warning("Checksum failed")
-                return None
-
-            return payload
+                return payload
 
         except Exception as e:
             logger.error(f"Error reading packet: {e}")
             return None
 
+    def _parse_poor_signal(self, payload, i, n, updates):
+        """Handle a poor-signal field; return the next parse index"""
+        if i < n:
+            signal_quality = payload[i]
+            updates['signal_quality'] = signal_quality
+            # Debug signal quality
+            if signal_quality > 50:
+                logger.warning(f"Poor signal quality: {signal_quality}")
+            i += 1
+        return i
+
+    def _parse_attention(self, payload, i, n, updates):
+        """Handle an attention field; return the next parse index"""
+        if i < n:
+            updates['attention'] = payload[i]
+            logger.debug(f"Attention: {payload[i]}")
+            i += 1
+        return i
+
+    def _parse_meditation(self, payload, i, n, updates):
+        """Handle a meditation field; return the next parse index"""
+        if i < n:
+            updates['meditation'] = payload[i]
+            logger.debug(f"Meditation: {payload[i]}")
+            i += 1
+        return i
+
+    def _parse_raw_value(self, payload, i, n, updates):
+        """Handle a raw-value field; return the next index or -1 if truncated"""
+        # Raw value is 2 bytes, big-endian signed 16-bit
+        if i + 2 > n:
+            return -1
+        raw_value = _RAW_VALUE_STRUCT.unpack_from(payload, i)[0]
+        updates['raw_value'] = raw_value
+        # Append to the raw ring (single writer; the mask wraps the head)
+        self._raw_ring[self._raw_head & (self.RAW_RING_SIZE - 1)] = raw_value
+        self._raw_head += 1
+        return i + 2
+
+    def _parse_eeg_power(self, payload, i, n, updates):
+        """Handle an ASIC band field; return the next index or -1 if truncated"""
+        # EEG band powers: 8 bands x 3 bytes each (24 bytes total)
+        if i + 24 > n:
+            return -1
+
+        # Poor-signal fields precede the band block in a ThinkGear packet;
+        # at 200 (no skin contact) the band values are garbage, so skip the
+        # decode and the nine dict stores and just advance past the block.
+        # _reset_data_on_poor_signal zeroes the published bands anyway
+        if updates.get('signal_quality', 0) >= 200:
+            return i + 24
+
+        # Decode all eight 3-byte big-endian bands out of one 192-bit
+        # integer: a single C-level conversion plus eight shift-and-mask
+        # extractions (the slice is a zero-copy view, not a new bytes)
+        block = int.from_bytes(payload[i:i + 24], 'big')
+        bands = [(block >> shift) & 0xFFFFFF for shift in _BAND_SHIFTS]
+
+        updates['delta'] = bands[0]
+        updates['theta'] = bands[1]
+        updates['low_alpha'] = bands[2]
+        updates['high_alpha'] = bands[3]
+        updates['alpha'] = (bands[2] + bands[3]) // 2
+        updates['low_beta'] = bands[4]
+        updates['high_beta'] = bands[5]
+        updates['low_gamma'] = bands[6]
+        updates['mid_gamma'] = bands[7]
+
+        # Debug alpha waves
+        logger.debug(f"Alpha waves - Low: {bands[2]}, High: {bands[3]}, Combined: {(bands[2] + bands[3]) // 2}")
+
+        return i + 24
+
+    # Jump table for the parser: field code -> handler, resolved once at
+    # class creation instead of an if/elif chain per field
+    _FIELD_PARSERS = {
+        CODE_POOR_SIGNAL: _parse_poor_signal,
+        CODE_ATTENTION: _parse_attention,
+        CODE_MEDITATION: _parse_meditation,
+        CODE_RAW_VALUE: _parse_raw_value,
+        CODE_ASIC_EEG_POWER: _parse_eeg_power,
+    }
+
     def _parse_packet(self, payload):
-        """Parse ThinkGear payload and update latest data"""
+        """Parse ThinkGear payload and publish updated data
+
+        The payload is wrapped in one memoryview up front: indexing still
+        yields plain ints, while the raw-value and band decodes read through
+        zero-copy sub-views instead of allocating sub-bytes per field.
+        """
         i = 0
+        n = len(payload)
+        payload = memoryview(payload)
+        excode = self.EXCODE
+        parsers = self._FIELD_PARSERS
+        updates = {}
         try:
-            while i < len(payload):
+            while i < n:
                 # Skip extended code bytes
-                while i < len(payload) and payload[i] == self.EXCODE:
+                while i < n and payload[i] == excode:
                     i += 1
 
                 # Make sure there is still data to read
-                if i >= len(payload):
+                if i >= n:
                     break
 
                 code = payload[i]
                 i += 1
 
-                if code == self.CODE_POOR_SIGNAL:
-                    if i < len(payload):
-                        signal_quality = payload[i]
-                        with self.data_lock:
-                            self.latest_data['signal_quality'] = signal_quality
-                        # Debug signal quality
-                        if signal_quality > 50:
-                            logger.warning(f"Poor signal quality: {signal_quality}")
-                        i += 1
-
-                elif code == self.CODE_ATTENTION:
-                    if i < len(payload):
-                        attention = payload[i]
-                        with self.data_lock:
-                            self.latest_data['attention'] = attention
-                        logger.debug(f"Attention: {attention}")
-                        i += 1
-
-                elif code == self.CODE_MEDITATION:
-                    if i < len(payload):
-                        meditation = payload[i]
-                        with self.data_lock:
-                            self.latest_data['meditation'] = meditation
-                        logger.debug(f"Meditation: {meditation}")
-                        i += 1
-
-                elif code == self.CODE_RAW_VALUE:
-                    # Raw value is 2 bytes, big-endian signed 16-bit
-                    if i + 2 <= len(payload):
-                        raw_value = struct.unpack('>h', bytes(payload[i:i+2]))[0]
-                        with self.data_lock:
-                            self.latest_data['raw_value'] = raw_value
-                        i += 2
-                    else:
-                        break
-
-                elif code == self.CODE_ASIC_EEG_POWER:
-                    # EEG band powers: 8 bands x 3 bytes each (24 bytes total)
-                    if i + 24 <= len(payload):
-                        bands = []
-                        for j in range(8):
-                            offset = i + (j * 3)
-                            # Each band is 3 bytes, big-endian
-                            value = (payload[offset] << 16) | (payload[offset+1] << 8) | payload[offset+2]
-                            bands.append(value)
-
-                        with self.data_lock:
-                            self.latest_data['delta'] = bands[0]
-                            self.latest_data['theta'] = bands[1]
-                            self.latest_data['low_alpha'] = bands[2]
-                            self.latest_data['high_alpha'] = bands[3]
-                            self.latest_data['alpha'] = (bands[2] + bands[3]) // 2
-                            self.latest_data['low_beta'] = bands[4]
-                            self.latest_data['high_beta'] = bands[5]
-                            self.latest_data['low_gamma'] = bands[6]
-                            self.latest_data['mid_gamma'] = bands[7]
-                        
-                        # Debug alpha waves
-                        logger.debug(f"Alpha waves - Low: {bands[2]}, High: {bands[3]}, Combined: {(bands[2] + bands[3]) // 2}")
-
-                        i += 24
-                    else:
+                handler = parsers.get(code)
+                if handler is not None:
+                    i = handler(self, payload, i, n, updates)
+                    if i < 0:
+                        # Field is truncated - discard the rest of the payload
                         break
-
                 else:
                     # Unknown code with length
                     if code >= 0x80:
                         # Multi-byte value
-                        if i < len(payload):
+                        if i < n:
                             vlength = payload[i]
                             i += 1
                             # Make sure the code doesn't read beyond payload
-                            if i + vlength <= len(payload):
+                            if i + vlength <= n:
                                 i += vlength
                             else:
                                 break
@@ -319,6 +427,10 @@ class MindWaveInterface:
         except Exception as e:
             logger.error(f"Error parsing packet: {e}")
 
+        # One snapshot swap per packet instead of a lock round-trip per field
+        if updates:
+            self._publish(updates)
+
     def read_data(self):
         """
         Get the latest EEG data
@@ -326,28 +438,57 @@ class MindWaveInterface:
         Returns:
             dict: Latest EEG measurements
         """
-        with self.data_lock:
-            return self.latest_data.copy()
+        # Snapshots are immutable once published, so the copy keeps callers
+        # that mutate the result from affecting other readers
+        return self.latest_data.copy()
+
+    def read_sample(self):
+        """
+        Get the latest control-relevant fields as an EEGSample
+
+        Returns:
+            EEGSample: (alpha, attention, meditation, signal_quality) from
+            the current snapshot, without copying the full data dict
+        """
+        data = self.latest_data
+        return EEGSample(data['alpha'], data['attention'],
+                         data['meditation'], data['signal_quality'])
+
+    def get_raw_window(self, n=256):
+        """
+        Get the most recent raw EEG samples in chronological order
+
+        Args:
+            n: Number of samples to return (capped at the ring size and at
+               the number of samples received so far)
+
+        Returns:
+            array('h'): Up to n int16 samples, oldest first, ready for an
+            FFT or other windowed analysis
+        """
+        head = self._raw_head  # read once; the read thread keeps advancing
+        n = min(n, head, self.RAW_RING_SIZE)
+        pos = head & (self.RAW_RING_SIZE - 1)
+        if n <= pos:
+            return self._raw_ring[pos - n:pos]
+        # Window wraps: stitch the tail of the ring onto the front
+        return self._raw_ring[pos - n:] + self._raw_ring[:pos]
 
     def is_signal_good(self):
         """Check if signal quality is good (0 = best, 200 = no contact)"""
-        with self.data_lock:
-            return self.latest_data['signal_quality'] < 50
+        return self.latest_data['signal_quality'] < 50
 
     def get_alpha_power(self):
         """Get current alpha wave power"""
-        with self.data_lock:
-            return self.latest_data['alpha']
+        return self.latest_data['alpha']
 
     def get_attention(self):
         """Get current attention level (0-100)"""
-        with self.data_lock:
-            return self.latest_data['attention']
+        return self.latest_data['attention']
 
     def get_meditation(self):
         """Get current meditation level (0-100)"""
-        with self.data_lock:
-            return self.latest_data['meditation']
+        return self.latest_data['meditation']
 
 
 if __name__ == "__main__":
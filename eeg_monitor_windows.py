@@ -6,9 +6,11 @@ Real-time EEG data monitoring while drone flies on Pi
 
 import serial
 import struct
+import sys
 import time
 import logging
-from threading import Thread, Lock
+from threading import Thread
+from queue import Queue, Empty, Full
 import json
 import requests
 
@@ -21,6 +23,7 @@ class WindowsEEGMonitor:
     
     # ThinkGear packet constants
     SYNC = 0xAA
+    SYNC_BYTES = b'\xaa\xaa'
     EXCODE = 0x55
     
     # Data codes
@@ -38,8 +41,16 @@ class WindowsEEGMonitor:
         self.is_connected = False
         self.is_reading = False
         self.read_thread = None
-        self.data_lock = Lock()
-        
+
+        # Receive buffer for bulk serial reads (packets are scanned out of
+        # this buffer instead of one read() call per byte)
+        self._rx_buffer = bytearray()
+
+        # Status lines go through a background writer so the monitor loop
+        # never blocks on console I/O
+        self._write_queue = Queue(maxsize=4)
+        self._writer_thread = None
+
         # Latest EEG data
         self.latest_data = {
             'signal_quality': 200,
@@ -69,7 +80,10 @@ class WindowsEEGMonitor:
         self.is_reading = True
         self.read_thread = Thread(target=self._read_loop, daemon=True)
         self.read_thread.start()
-        
+
+        self._writer_thread = Thread(target=self._write_loop, daemon=True)
+        self._writer_thread.start()
+
         logger.info("Starting EEG monitoring...")
         logger.info("Press Ctrl+C to stop")
         
@@ -95,100 +109,104 @@ class WindowsEEGMonitor:
                 logger.error(f"Error reading packet: {e}")
                 time.sleep(0.1)
     
+    def _fill_rx_buffer(self):
+        """Pull everything the serial driver has buffered into _rx_buffer"""
+        chunk = self.serial_conn.read(self.serial_conn.in_waiting or 1)
+        if not chunk:
+            return False
+        self._rx_buffer.extend(chunk)
+        return True
+
     def _read_packet(self):
         """Read a single ThinkGear packet"""
         if not self.serial_conn or not self.serial_conn.is_open:
             return None
-        
+
         try:
-            # Wait for sync bytes
+            buf = self._rx_buffer
             while True:
-                byte = self.serial_conn.read(1)
-                if not byte:
+                # Locate the sync bytes (0xAA 0xAA) in the buffered data
+                start = buf.find(self.SYNC_BYTES)
+                if start < 0:
+                    # Keep one byte in case it is half a split sync pair
+                    del buf[:-1]
+                    if not self._fill_rx_buffer():
+                        return None
+                    continue
+
+                if len(buf) < start + 3:
+                    if not self._fill_rx_buffer():
+                        return None
+                    continue
+
+                plength = buf[start + 2]
+                if plength > 169:
+                    # Bogus header - resync just past this sync pair
+                    del buf[:start + 2]
+                    continue
+
+                # Wait for payload + checksum to arrive
+                end = start + 3 + plength + 1
+                while len(buf) < end:
+                    if not self._fill_rx_buffer():
+                        return None
+
+                payload = bytes(buf[start + 3:end - 1])
+                checksum = buf[end - 1]
+                del buf[:end]
+
+                # One C-level sum over the bytes, inverted and masked
+                if (~sum(payload)) & 0xFF != checksum:
                     return None
-                
-                if ord(byte) == self.SYNC:
-                    byte2 = self.serial_conn.read(1)
-                    if byte2 and ord(byte2) == self.SYNC:
-                        break
-            
-            # Read payload length
-            plength_byte = self.serial_conn.read(1)
-            if not plength_byte:
-                return None
-            
-            plength = ord(plength_byte)
-            if plength > 169:
-                return None
-            
-            # Read payload
-            payload = self.serial_conn.read(plength)
-            if len(payload) != plength:
-                return None
-            
-            # Read checksum
-            checksum_byte = self.serial_conn.read(1)
-            if not checksum_byte:
-                return None
-            
-            checksum = ord(checksum_byte)
-            payload_sum = sum(payload) & 0xFF
-            if ((~payload_sum) & 0xFF) != checksum:
-                return None
-            
-            return payload
-            
+
+                return payload
+
         except Exception as e:
             logger.error(f"Error reading packet: {e}")
             return None
     
     def _parse_packet(self, payload):
-        """Parse ThinkGear payload"""
+        """Parse ThinkGear payload and publish a fresh snapshot"""
         i = 0
+        # Zero-copy view: the alpha-band slices below read through it
+        # instead of allocating sub-bytes objects
+        payload = memoryview(payload)
+        updates = {}
         try:
             while i < len(payload):
                 # Skip extended code bytes
                 while i < len(payload) and payload[i] == self.EXCODE:
                     i += 1
-                
+
                 if i >= len(payload):
                     break
-                
+
                 code = payload[i]
                 i += 1
-                
+
                 if code == self.CODE_POOR_SIGNAL:
                     if i < len(payload):
-                        signal_quality = payload[i]
-                        with self.data_lock:
-                            self.latest_data['signal_quality'] = signal_quality
+                        updates['signal_quality'] = payload[i]
                         i += 1
-                
+
                 elif code == self.CODE_ATTENTION:
                     if i < len(payload):
-                        attention = payload[i]
-                        with self.data_lock:
-                            self.latest_data['attention'] = attention
+                        updates['attention'] = payload[i]
                         i += 1
-                
+
                 elif code == self.CODE_MEDITATION:
                     if i < len(payload):
-                        meditation = payload[i]
-                        with self.data_lock:
-                            self.latest_data['meditation'] = meditation
+                        updates['meditation'] = payload[i]
                         i += 1
-                
+
                 elif code == self.CODE_ASIC_EEG_POWER:
                     if i + 24 <= len(payload):
-                        bands = []
-                        for j in range(8):
-                            offset = i + (j * 3)
-                            value = (payload[offset] << 16) | (payload[offset+1] << 8) | payload[offset+2]
-                            bands.append(value)
-                        
-                        with self.data_lock:
-                            self.latest_data['alpha'] = (bands[2] + bands[3]) // 2
-                        
+                        # Only the two alpha bands (3rd and 4th 3-byte values)
+                        # are displayed, so decode just those with C-level
+                        # int.from_bytes instead of shift/OR-ing all eight
+                        low_alpha = int.from_bytes(payload[i + 6:i + 9], 'big')
+                        high_alpha = int.from_bytes(payload[i + 9:i + 12], 'big')
+                        updates['alpha'] = (low_alpha + high_alpha) // 2
                         i += 24
                     else:
                         break
@@ -208,12 +226,20 @@ class WindowsEEGMonitor:
         
         except Exception as e:
             logger.error(f"Error parsing packet: {e}")
-    
+
+        # Swap in a fresh snapshot once per packet; the read thread is the
+        # only writer and published snapshots are never mutated, so readers
+        # just grab the current reference
+        if updates:
+            updates['timestamp'] = time.time()
+            new_data = dict(self.latest_data)
+            new_data.update(updates)
+            self.latest_data = new_data
+
     def _display_data(self):
         """Display current EEG data"""
-        with self.data_lock:
-            data = self.latest_data.copy()
-        
+        data = self.latest_data  # shared snapshot; no lock or copy needed
+
         signal = data['signal_quality']
         alpha = data['alpha']
         attention = data['attention']
@@ -227,13 +253,28 @@ class WindowsEEGMonitor:
         else:
             signal_status = "POOR"
         
-        print(f"\rSignal: {signal:3d} ({signal_status}) | Alpha: {alpha:6d} | Attention: {attention:3d} | Meditation: {meditation:3d}", end="", flush=True)
+        line = f"\rSignal: {signal:3d} ({signal_status}) | Alpha: {alpha:6d} | Attention: {attention:3d} | Meditation: {meditation:3d}"
+        try:
+            self._write_queue.put_nowait(line)
+        except Full:
+            pass  # console is behind; drop this update rather than stall
+
+    def _write_loop(self):
+        """Background thread that writes queued status lines to the console"""
+        while self.is_reading or not self._write_queue.empty():
+            try:
+                line = self._write_queue.get(timeout=0.5)
+            except Empty:
+                continue
+            sys.stdout.write(line)
+            sys.stdout.flush()
     
     def get_latest_data(self):
         """Get latest EEG data"""
-        with self.data_lock:
-            return self.latest_data.copy()
-    
+        # Snapshots are immutable once published; copy so callers that
+        # mutate the result cannot affect other readers
+        return self.latest_data.copy()
+
     def stop(self):
         """Stop monitoring"""
         self.is_reading = False
@@ -2,7 +2,8 @@ import serial
 import struct
 import logging
 import time
-from threading import Thread, Lock
+from threading import Thread
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(
@@ -20,8 +21,10 @@ class MindWaveWindowsInterface:
         self.is_connected = False
         self.is_reading = False
         self.read_thread = None
-        self.data_lock = Lock()
-        
+
+        # Receive buffer for bulk serial reads
+        self._rx_buffer = bytearray()
+
         # Initialize data structure
         self.latest_data = {
             'signal_quality': 200,
@@ -51,92 +54,114 @@ class MindWaveWindowsInterface:
             self.serial_conn.close()
             logger.info("MindWave disconnected")
 
+    def _fill_rx_buffer(self):
+        """Pull everything the serial driver has buffered into _rx_buffer"""
+        chunk = self.serial_conn.read(self.serial_conn.in_waiting or 1)
+        if not chunk:
+            return False
+        self._rx_buffer.extend(chunk)
+        return True
+
     def _read_packet(self):
         """Read a packet from MindWave"""
         try:
-            # Look for sync bytes (0xAA, 0xAA)
+            buf = self._rx_buffer
             while True:
-                byte1 = self.serial_conn.read(1)
-                if not byte1:
-                    return None
-                
-                if byte1[0] == 0xAA:
-                    byte2 = self.serial_conn.read(1)
-                    if byte2 and byte2[0] == 0xAA:
-                        # Found sync bytes, read the rest of the packet
-                        payload_length = self.serial_conn.read(1)[0]
-                        payload = self.serial_conn.read(payload_length)
-                        checksum = self.serial_conn.read(1)[0]
-                        
-                        # Verify checksum
-                        calculated_checksum = 0
-                        for byte in payload:
-                            calculated_checksum ^= byte
-                        
-                        if calculated_checksum == checksum:
-                            return payload
-                        else:
-                            logger.warning("Checksum mismatch")
-                            continue
+                # Look for sync bytes (0xAA, 0xAA) in the buffered data
+                start = buf.find(b'\xaa\xaa')
+                if start < 0:
+                    # Keep one byte in case it is half a split sync pair
+                    del buf[:-1]
+                    if not self._fill_rx_buffer():
+                        return None
+                    continue
+
+                if len(buf) < start + 3:
+                    if not self._fill_rx_buffer():
+                        return None
+                    continue
+
+                payload_length = buf[start + 2]
+                end = start + 3 + payload_length + 1
+                while len(buf) < end:
+                    if not self._fill_rx_buffer():
+                        return None
+
+                payload = bytes(buf[start + 3:end - 1])
+                checksum = buf[end - 1]
+                del buf[:end]
+
+                # Verify checksum: ThinkGear uses the inverted payload sum
+                # (not XOR), computed here with one C-level sum over bytes
+                if (~sum(payload)) & 0xFF == checksum:
+                    return payload
+                logger.warning("Checksum mismatch")
         except Exception as e:
             logger.error(f"Error reading packet: {e}")
             return None
 
     def _parse_packet(self, payload):
-        """Parse MindWave packet"""
-        with self.data_lock:
-            i = 0
-            while i < len(payload):
-                code = payload[i]
-                
-                if code == 0x02:  # Signal quality
-                    if i + 1 < len(payload):
-                        self.latest_data['signal_quality'] = payload[i + 1]
-                        i += 2
-                    else:
-                        break
-                        
-                elif code == 0x04:  # Attention
-                    if i + 1 < len(payload):
-                        self.latest_data['attention'] = payload[i + 1]
-                        i += 2
-                    else:
-                        break
-                        
-                elif code == 0x05:  # Meditation
-                    if i + 1 < len(payload):
-                        self.latest_data['meditation'] = payload[i + 1]
-                        i += 2
-                    else:
-                        break
-                        
-                elif code == 0x80:  # Raw wave data
-                    if i + 3 < len(payload):
-                        # Skip raw wave data for now
-                        i += 4
-                    else:
-                        break
-                        
-                elif code == 0x83:  # EEG power bands
-                    if i + 25 < len(payload):
-                        # Parse EEG power bands
-                        delta = struct.unpack('<I', payload[i+1:i+5])[0]
-                        theta = struct.unpack('<I', payload[i+5:i+9])[0]
-                        low_alpha = struct.unpack('<I', payload[i+9:i+13])[0]
-                        high_alpha = struct.unpack('<I', payload[i+13:i+17])[0]
-                        low_beta = struct.unpack('<I', payload[i+17:i+21])[0]
-                        high_beta = struct.unpack('<I', payload[i+21:i+25])[0]
-                        
-                        self.latest_data['alpha'] = low_alpha + high_alpha
-                        self.latest_data['beta'] = low_beta + high_beta
-                        self.latest_data['theta'] = theta
-                        self.latest_data['delta'] = delta
-                        
-                        i += 25
-                    else:
-                        break
+        """Parse MindWave packet and publish a fresh snapshot"""
+        i = 0
+        updates = {}
+        while i < len(payload):
+            code = payload[i]
+
+            if code == 0x02:  # Signal quality
+                if i + 1 < len(payload):
+                    updates['signal_quality'] = payload[i + 1]
+                    i += 2
+                else:
+                    break
+
+            elif code == 0x04:  # Attention
+                if i + 1 < len(payload):
+                    updates['attention'] = payload[i + 1]
+                    i += 2
+                else:
+                    break
+
+            elif code == 0x05:  # Meditation
+                if i + 1 < len(payload):
+                    updates['meditation'] = payload[i + 1]
+                    i += 2
+                else:
+                    break
+
+            elif code == 0x80:  # Raw wave data
+                if i + 3 < len(payload):
+                    # Skip raw wave data for now
+                    i += 4
                 else:
-                    i += 1
+                    break
+
+            elif code == 0x83:  # EEG power bands
+                if i + 25 < len(payload):
+                    # Parse EEG power bands
+                    delta = struct.unpack('<I', payload[i+1:i+5])[0]
+                    theta = struct.unpack('<I', payload[i+5:i+9])[0]
+                    low_alpha = struct.unpack('<I', payload[i+9:i+13])[0]
+                    high_alpha = struct.unpack('<I', payload[i+13:i+17])[0]
+                    low_beta = struct.unpack('<I', payload[i+17:i+21])[0]
+                    high_beta = struct.unpack('<I', payload[i+21:i+25])[0]
+
+                    updates['alpha'] = low_alpha + high_alpha
+                    updates['beta'] = low_beta + high_beta
+                    updates['theta'] = theta
+                    updates['delta'] = delta
+
+                    i += 25
+                else:
+                    break
+            else:
+                i += 1
+
+        # The read thread is the only writer: publish all fields with one
+        # snapshot swap instead of holding a lock for the whole parse
+        if updates:
+            new_data = dict(self.latest_data)
+            new_data.update(updates)
+            self.latest_data = new_data
 
     def start_reading(self):
         """Start reading data in background thread"""
@@ -166,8 +191,9 @@ class MindWaveWindowsInterface:
 
     def get_latest_data(self):
         """Get latest EEG data"""
-        with self.data_lock:
-            return self.latest_data.copy()
+        # Snapshots are immutable once published; copy so callers cannot
+        # affect other readers
+        return self.latest_data.copy()
 
     def stop_reading(self):
         """Stop reading data"""
@@ -175,24 +201,39 @@ class MindWaveWindowsInterface:
         if self.read_thread:
             self.read_thread.join()
 
+def _try_port(port):
+    """Attempt to open a MindWave connection on a single COM port"""
+    interface = MindWaveWindowsInterface(port=port)
+    if interface.connect():
+        return interface
+    return None
+
+
 def main():
     print("Windows MindWave Test")
     print("====================")
     print("Testing MindWave connection on Windows...")
-    
-    # Try different COM ports
+
+    # Try different COM ports in parallel: each failed open waits out its
+    # own driver timeout, so a serial scan multiplies the worst case by
+    # the number of candidate ports
     com_ports = ['COM3', 'COM4', 'COM5', 'COM6']
     eeg_interface = None
-    
-    for port in com_ports:
-        print(f"Trying {port}...")
-        eeg_interface = MindWaveWindowsInterface(port=port)
-        if eeg_interface.connect():
+
+    print(f"Scanning {', '.join(com_ports)} in parallel...")
+    with ThreadPoolExecutor(max_workers=len(com_ports)) as executor:
+        results = list(executor.map(_try_port, com_ports))
+
+    for port, interface in zip(com_ports, results):
+        if interface is None:
+            print(f"Failed to connect on {port}")
+        elif eeg_interface is None:
+            # Keep the first (lowest-numbered) port that answered
+            eeg_interface = interface
             print(f"SUCCESS: Connected to MindWave on {port}")
-            break
         else:
-            print(f"Failed to connect on {port}")
-    
+            interface.disconnect()
+
     if not eeg_interface or not eeg_interface.is_connected:
         print("ERROR: Could not connect to MindWave on any COM port")
         print("Make sure MindWave is paired and connected via Bluetooth")
@@ -5,26 +5,35 @@ Main control script for integrating MindWave EEG headset with DJI Tello drone
 using cylindrical coordinates (r, theta, z) derived from alpha wave activity.
 """
 
+import atexit
 import time
 import logging
 import signal
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue, Empty, Full
 from threading import Event, Thread
 from eeg_interface import MindWaveInterface
 from tello_controller import TelloController
 from coordinate_mapper import CylindricalCoordinateMapper
 from config import Config
-from web_server import EEGWebServer
 
-# Setup logging
+# Setup logging: the control thread only drops records onto a queue; a
+# listener thread does the actual file/console writes, so synchronous
+# disk I/O never stalls the control loop
+_log_queue = Queue()
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('eeg_drone_control.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
+_log_listener = QueueListener(
+    _log_queue,
+    logging.FileHandler('eeg_drone_control.log'),
+    logging.StreamHandler(sys.stdout)
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # Global shutdown event
@@ -49,6 +58,16 @@ class EEGDroneController:
         self.web_thread = None
         self.is_running = False
 
+        # Producer/consumer pipeline: the producer thread polls EEG samples
+        # onto this bounded queue so serial-side latency never stalls the
+        # command dispatch path. Small maxsize keeps samples fresh
+        self._sample_q = Queue(maxsize=4)
+        self._producer_thread = None
+
+        # Command rate gate compares integer nanoseconds on the monotonic
+        # clock: immune to wall-clock steps, and cheaper than float math
+        self._cmd_interval_ns = int(config.COMMAND_INTERVAL * 1e9)
+
     def initialize(self):
         """Initialize all components"""
         try:
@@ -57,6 +76,8 @@ class EEGDroneController:
             # Initialize coordinate mapper
             logger.info("Initializing coordinate mapper...")
             self.mapper = CylindricalCoordinateMapper(self.config)
+            # Pay any JIT compilation cost now, not on the first tick in the air
+            self.mapper.warmup()
 
             # Initialize EEG headset with error handling
             logger.info("Initializing MindWave EEG headset...")
@@ -75,6 +96,9 @@ class EEGDroneController:
             if self.config.ENABLE_WEB_SERVER:
                 try:
                     logger.info("Starting web visualization server...")
+                    # Imported here so startup skips the Flask/SocketIO
+                    # import cost whenever the dashboard is disabled
+                    from web_server import EEGWebServer
                     self.web_server = EEGWebServer(self.eeg, self.config)
                     self.web_thread = Thread(target=self.web_server.start, daemon=True)
                     self.web_thread.start()
@@ -142,6 +166,61 @@ class EEGDroneController:
             logger.error(f"Initialization failed: {e}")
             return False
 
+    def _eeg_producer(self):
+        """Producer thread: feed EEG samples onto the queue for the control loop"""
+        q = self._sample_q
+        read_sample = self.eeg.read_sample
+        delay = self.config.LOOP_DELAY
+        shutdown_is_set = shutdown_event.is_set
+
+        while self.is_running and not shutdown_is_set():
+            sample = read_sample()
+            try:
+                q.put_nowait(sample)
+            except Full:
+                # Drop the oldest sample so the consumer always sees
+                # the freshest data instead of a backlog
+                try:
+                    q.get_nowait()
+                except Empty:
+                    pass
+                try:
+                    q.put_nowait(sample)
+                except Full:
+                    pass
+            time.sleep(delay)
+
+        # Sentinel wakes the consumer promptly on shutdown (evict a stale
+        # sample if the queue is full so it always lands)
+        try:
+            q.put_nowait(None)
+        except Full:
+            try:
+                q.get_nowait()
+            except Empty:
+                pass
+            try:
+                q.put_nowait(None)
+            except Full:
+                pass
+
+    @staticmethod
+    def _drain_latest(q, newest):
+        """Drain any queued samples and return the newest one
+
+        If samples arrive faster than the loop consumes them, only the most
+        recent one can become the next RC command; mapping the stale backlog
+        would be wasted work. Returns None if the shutdown sentinel is hit.
+        """
+        while True:
+            try:
+                candidate = q.get_nowait()
+            except Empty:
+                return newest
+            if candidate is None:
+                return None
+            newest = candidate
+
     def start(self):
         """Start the control loop"""
         if not self.initialize():
@@ -153,76 +232,108 @@ class EEGDroneController:
         logger.info("Press CTRL+C to stop and land the drone")
 
         try:
+            # Start the EEG producer before takeoff so samples are consumed
+            # continuously instead of piling up during the takeoff wait and
+            # hitting the first control tick as a burst
+            self._producer_thread = Thread(target=self._eeg_producer, daemon=True)
+            self._producer_thread.start()
+
             # Takeoff
             if self.config.AUTO_TAKEOFF:
                 logger.info("Taking off...")
                 self.drone.takeoff()
-                time.sleep(3)
+                # Interruptible settle wait: CTRL+C during takeoff lands
+                # immediately instead of riding out the full 3 seconds
+                if shutdown_event.wait(3):
+                    return
 
             control_loop_count = 0
-            last_command_time = time.time()
-
-            while self.is_running and not shutdown_event.is_set():
+            no_data_count = 0
+            _mono_ns = time.monotonic_ns
+            cmd_interval_ns = self._cmd_interval_ns
+            last_command_ns = _mono_ns()
+
+            # Hoist the per-iteration attribute chains to locals: each
+            # dotted access is a dict lookup, and these run at loop rate
+            sample_get = self._sample_q.get
+            drain_latest = self._drain_latest
+            sample_q = self._sample_q
+            map_coords = self.mapper.map_alpha_to_coordinates
+            to_velocity = self.mapper.cylindrical_to_velocity
+            send_rc = self.drone.send_rc_control
+            loop_delay = self.config.LOOP_DELAY
+            max_poor = self.config.MAX_POOR_SIGNAL
+            # Bound method as a local: the loop header becomes one
+            # LOAD_FAST + call instead of a global plus attribute chase
+            shutdown_is_set = shutdown_event.is_set
+
+            while self.is_running and not shutdown_is_set():
                 try:
-                    # Read EEG data
-                    eeg_data = self.eeg.read_data()
-
-                    if eeg_data and 'alpha' in eeg_data:
-                        alpha_power = eeg_data['alpha']
-                        attention = eeg_data.get('attention', 0)
-                        meditation = eeg_data.get('meditation', 0)
-                        signal_quality = eeg_data.get('signal_quality', 200)
-
-                        # Check signal quality
-                        if signal_quality > self.config.MAX_POOR_SIGNAL:
-                            if control_loop_count % 20 == 0:  # Log every 20 iterations when signal is poor
-                                logger.warning(f"Poor EEG signal quality: {signal_quality} (max good: {self.config.MAX_POOR_SIGNAL})")
-                                logger.warning("Check headset contact and positioning")
-                            # Skip control commands when signal is poor
-                            time.sleep(self.config.LOOP_DELAY)
-                            continue
-
-                        # Log EEG metrics
-                        if control_loop_count % 10 == 0:  # Log every 10 iterations
-                            logger.info(f"Signal: {signal_quality}, Alpha: {alpha_power}, Attention: {attention}, Meditation: {meditation}")
-
-                        # Map alpha waves to cylindrical coordinates
-                        r, theta, z = self.mapper.map_alpha_to_coordinates(
-                            alpha_power, attention, meditation
-                        )
-
-                        # Convert cylindrical to drone velocity commands
-                        vx, vy, vz, yaw = self.mapper.cylindrical_to_velocity(r, theta, z)
-
-                        # Validate command values
-                        vx = max(-100, min(100, vx))
-                        vy = max(-100, min(100, vy))
-                        vz = max(-100, min(100, vz))
-                        yaw = max(-100, min(100, yaw))
-
-                        # Send command to drone (with rate limiting)
-                        current_time = time.time()
-                        if current_time - last_command_time >= self.config.COMMAND_INTERVAL:
-                            try:
-                                self.drone.send_rc_control(vx, vy, vz, yaw)
-                                last_command_time = current_time
-                            except Exception as e:
-                                logger.error(f"Failed to send drone command: {e}")
-                                # Continue trying to send commands
-
-                        control_loop_count += 1
-                    else:
-                        # No valid EEG data
-                        if control_loop_count % 50 == 0:  # Log every 50 iterations when no data
-                            logger.warning("No valid EEG data received - check headset connection")
+                    # Wait for the next EEG sample from the producer
+                    try:
+                        sample = sample_get(timeout=loop_delay)
+                    except Empty:
+                        # The queue wait is the loop's only pacing; count
+                        # misses so a silent producer is still noticed
+                        no_data_count += 1
+                        if no_data_count % 100 == 0:  # ~5 s between warnings
+                            logger.warning("No EEG samples arriving - check headset connection")
+                        continue
+                    no_data_count = 0
+                    if sample is None:
+                        # Producer shutdown sentinel
+                        break
+
+                    # Coalesce any backlog: map only the newest sample
+                    sample = drain_latest(sample_q, sample)
+                    if sample is None:
+                        break
+
+                    # Samples are fixed-shape tuples, so one unpack replaces
+                    # the old membership check plus three dict .get calls
+                    alpha_power, attention, meditation, signal_quality = sample
+
+                    # Check signal quality
+                    if signal_quality > max_poor:
+                        if control_loop_count % 20 == 0:  # Log every 20 iterations when signal is poor
+                            # Deferred %-formatting: no string build
+                            # unless the record passes the level filter
+                            logger.warning("Poor EEG signal quality: %s (max good: %s)",
+                                           signal_quality, max_poor)
+                            logger.warning("Check headset contact and positioning")
+                        # Skip control commands when signal is poor;
+                        # the queue wait above already paces the loop
+                        continue
+
+                    # Log EEG metrics
+                    if control_loop_count % 10 == 0:  # Log every 10 iterations
+                        logger.info("Signal: %s, Alpha: %s, Attention: %s, Meditation: %s",
+                                    signal_quality, alpha_power, attention, meditation)
+
+                    # Map alpha waves to cylindrical coordinates
+                    r, theta, z = map_coords(alpha_power, attention, meditation)
+
+                    # Convert cylindrical to drone velocity commands;
+                    # the kernel already clamps each component to the
+                    # Tello range (-100..100), so no re-validation here
+                    vx, vy, vz, yaw = to_velocity(r, theta, z)
+
+                    # Send command to drone (with rate limiting)
+                    now_ns = _mono_ns()
+                    if now_ns - last_command_ns >= cmd_interval_ns:
+                        try:
+                            send_rc(vx, vy, vz, yaw)
+                            last_command_ns = now_ns
+                        except Exception as e:
+                            logger.error(f"Failed to send drone command: {e}")
+                            # Continue trying to send commands
+
+                    control_loop_count += 1
 
                 except Exception as e:
                     logger.error(f"Error in control loop: {e}")
                     # Continue the loop even if there's an error
 
-                # Small delay to prevent overwhelming the system
-                time.sleep(self.config.LOOP_DELAY)
-
         except KeyboardInterrupt:
             logger.info("Keyboard interrupt received")
         except Exception as e:
@@ -235,6 +346,10 @@ class EEGDroneController:
         self.is_running = False
         logger.info("Stopping EEG-Drone control system...")
 
+        # Stop the EEG producer thread
+        if self._producer_thread and self._producer_thread.is_alive():
+            self._producer_thread.join(timeout=2)
+
         # Stop web server first
         if self.web_server:
             try:
@@ -278,23 +393,21 @@ class EEGDroneController:
 
 def check_dependencies():
     """Check if all required dependencies are available"""
+    from importlib.util import find_spec
+
     missing_deps = []
-    
-    try:
-        import serial
-    except ImportError:
+
+    # find_spec confirms a module is installed without paying its full
+    # import cost during startup
+    if find_spec("serial") is None:
         missing_deps.append("pyserial")
-    
-    try:
-        import numpy
-    except ImportError:
+
+    if find_spec("numpy") is None:
         missing_deps.append("numpy")
-    
-    try:
-        import socket
-    except ImportError:
+
+    if find_spec("socket") is None:
         missing_deps.append("socket (built-in)")
-    
+
     if missing_deps:
         logger.error(f"Missing dependencies: {', '.join(missing_deps)}")
         logger.error("Install with: pip3 install " + " ".join(missing_deps))
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Asyncio DJI Tello Drone Controller
+Single-event-loop alternative to tello_controller.TelloController:
+UDP transports replace the receiver threads, and per-command Futures
+replace the response lock + Event handshake
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+
+from tello_controller import _clip100, _parse_state
+
+logger = logging.getLogger(__name__)
+
+
+class _CommandProtocol(asyncio.DatagramProtocol):
+    """Resolves pending command futures as responses arrive"""
+
+    def __init__(self, controller):
+        self.controller = controller
+
+    def datagram_received(self, data, addr):
+        # Tello answers commands in order, so the oldest pending future
+        # owns this datagram
+        pending = self.controller._pending
+        while pending:
+            fut = pending.popleft()
+            if not fut.done():
+                fut.set_result(data.decode('utf-8').strip())
+                return
+        logger.debug(f"Unsolicited response: {data!r}")
+
+    def error_received(self, exc):
+        logger.error(f"Command transport error: {exc}")
+
+
+class _StateProtocol(asyncio.DatagramProtocol):
+    """Parses state datagrams and publishes them on the controller"""
+
+    def __init__(self, controller):
+        self.controller = controller
+
+    def datagram_received(self, data, addr):
+        # Same single-assignment snapshot publication as the threaded
+        # controller: fresh dict per datagram, never mutated afterwards
+        self.controller.state_data = _parse_state(data)
+
+    def error_received(self, exc):
+        logger.error(f"State transport error: {exc}")
+
+
+class AsyncTelloController:
+    """Controller for DJI Tello drone via asyncio UDP transports
+
+    Runs entirely on one event loop: no background threads, no locks,
+    and commands can be awaited concurrently since each gets its own
+    Future resolved by the protocol callback.
+    """
+
+    # Re-send an unchanged RC frame after this long (see TelloController)
+    RC_KEEPALIVE_INTERVAL = 0.1
+
+    def __init__(self, host='192.168.10.1', port=8889, state_port=8890):
+        """
+        Initialize async Tello controller
+
+        Args:
+            host: Tello IP address (default: 192.168.10.1)
+            port: Command port (default: 8889)
+            state_port: State data port (default: 8890)
+        """
+        self.host = host
+        self.port = port
+        self.state_port = state_port
+
+        self.transport = None
+        self.state_transport = None
+        self.is_connected = False
+
+        # Futures for in-flight commands, oldest first
+        self._pending = deque()
+
+        # Latest published state snapshot (read-only to callers)
+        self.state_data = {}
+
+        # Last RC frame sent, for duplicate suppression
+        self._last_rc = None
+        self._last_rc_time = 0.0
+
+    async def connect(self):
+        """Open the UDP endpoints and put the Tello in command mode"""
+        loop = asyncio.get_running_loop()
+        logger.info("Connecting to Tello...")
+
+        # Unlike socket.bind, create_datagram_endpoint resolves local_addr
+        # through getaddrinfo, which rejects the empty string - spell the
+        # wildcard address out explicitly
+        self.transport, _ = await loop.create_datagram_endpoint(
+            lambda: _CommandProtocol(self),
+            local_addr=('0.0.0.0', 9000),
+            remote_addr=(self.host, self.port))
+
+        self.state_transport, _ = await loop.create_datagram_endpoint(
+            lambda: _StateProtocol(self),
+            local_addr=('0.0.0.0', self.state_port))
+
+        for attempt in range(3):
+            logger.info(f"Sending 'command' to Tello (attempt {attempt + 1}/3)...")
+            response = await self.send_command("command", timeout=5)
+            if response and response.lower() == "ok":
+                self.is_connected = True
+                logger.info("Tello connected successfully")
+                return True
+            logger.warning(f"Attempt {attempt + 1} failed, response: {response}")
+            if attempt < 2:
+                await asyncio.sleep(2)
+
+        logger.error("Failed to enter command mode after 3 attempts")
+        return False
+
+    async def disconnect(self):
+        """Disconnect from Tello"""
+        logger.info("Disconnecting from Tello...")
+
+        try:
+            if self.transport and self.is_connected:
+                self.transport.sendto(b'emergency')
+                await asyncio.sleep(0.1)
+        except Exception:
+            pass
+
+        for fut in self._pending:
+            if not fut.done():
+                fut.cancel()
+        self._pending.clear()
+
+        if self.transport:
+            self.transport.close()
+        if self.state_transport:
+            self.state_transport.close()
+
+        self.is_connected = False
+
+    async def send_command(self, command, timeout=5):
+        """
+        Send command to Tello and wait for response
+
+        Args:
+            command: Command string
+            timeout: Timeout in seconds
+
+        Returns:
+            Response string or None
+        """
+        logger.debug(f"Sending command: {command}")
+
+        fut = asyncio.get_running_loop().create_future()
+        self._pending.append(fut)
+        self.transport.sendto(command.encode('utf-8'))
+
+        try:
+            return await asyncio.wait_for(fut, timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Command timeout: {command}")
+            try:
+                self._pending.remove(fut)
+            except ValueError:
+                pass
+            return None
+
+    async def takeoff(self):
+        """Take off with retry logic"""
+        logger.info("Taking off...")
+        for attempt in range(3):
+            if attempt > 0:
+                logger.warning(f"Takeoff attempt {attempt + 1}/3...")
+                await self.send_command("command", timeout=3)
+                await asyncio.sleep(1)
+            response = await self.send_command("takeoff", timeout=15)
+            if response == "ok":
+                return True
+        logger.error("Takeoff failed after 3 attempts")
+        return False
+
+    async def land(self):
+        """Land"""
+        logger.info("Landing...")
+        response = await self.send_command("land", timeout=10)
+        return response == "ok"
+
+    async def emergency(self):
+        """Emergency stop motors"""
+        logger.warning("EMERGENCY STOP")
+        response = await self.send_command("emergency")
+        return response == "ok"
+
+    def send_rc_control(self, left_right, forward_backward, up_down, yaw):
+        """
+        Send RC control command (velocity control)
+
+        Fire-and-forget like the threaded controller: the Tello never
+        answers rc frames, and transport.sendto never blocks the loop.
+
+        Args:
+            left_right: Left/right velocity (-100 to 100)
+            forward_backward: Forward/backward velocity (-100 to 100)
+            up_down: Up/down velocity (-100 to 100)
+            yaw: Yaw velocity (-100 to 100)
+        """
+        rc = (_clip100(left_right), _clip100(forward_backward),
+              _clip100(up_down), _clip100(yaw))
+        now = time.monotonic()
+        if rc == self._last_rc and now - self._last_rc_time < self.RC_KEEPALIVE_INTERVAL:
+            return
+        self._last_rc = rc
+        self._last_rc_time = now
+
+        self.transport.sendto(b"rc %d %d %d %d" % rc)
+
+    async def get_battery(self):
+        """Get battery percentage"""
+        response = await self.send_command("battery?")
+        try:
+            return int(response) if response else 0
+        except ValueError:
+            return 0
+
+    def get_state(self):
+        """Get current state data
+
+        Returns the latest published snapshot; treat it as read-only,
+        since the state protocol replaces (never mutates) the dict.
+        """
+        return self.state_data
+
+    def get_height(self):
+        """Get current height from state data"""
+        return self.state_data.get('h', 0)  # Height in cm
+
+
+if __name__ == "__main__":
+    # Test the async controller
+    logging.basicConfig(level=logging.INFO)
+
+    print("Async Tello Controller Test")
+    print("Make sure you are connected to Tello WiFi")
+
+    async def _main():
+        drone = AsyncTelloController()
+        if await drone.connect():
+            print(f"Battery: {await drone.get_battery()}%")
+
+            # Test RC control (hover in place)
+            print("\nTesting RC control for 5 seconds...")
+            for i in range(50):
+                drone.send_rc_control(0, 0, 0, 0)
+                await asyncio.sleep(0.1)
+
+            print("\nTest complete")
+        await drone.disconnect()
+
+    asyncio.run(_main())
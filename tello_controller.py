@@ -4,6 +4,9 @@ DJI Tello Drone Controller
 Handles WiFi communication and control commands for DJI Tello drone
 """
 
+import os
+import re
+import selectors
 import socket
 import threading
 import time
@@ -11,10 +14,35 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Tello state "key:value;" pairs, matched in one pass over the raw bytes.
+# The value alternative with commas covers mpry's "p,r,y" triple
+_STATE_RE = re.compile(rb'([A-Za-z]+):(-?\d+(?:\.\d+)?(?:,-?\d+(?:\.\d+)?)*)')
+
+
+def _parse_state(data):
+    """Parse a Tello state datagram into a {field: value} dict
+
+    Numeric fields become floats; mpry keeps its "p,r,y" string form,
+    as the original split-based parser left it.
+    """
+    return {m.group(1).decode():
+            v.decode() if b',' in (v := m.group(2)) else float(v)
+            for m in _STATE_RE.finditer(data)}
+
+
+def _clip100(value):
+    """Clamp an RC component to the Tello -100..100 range"""
+    value = int(value)
+    return -100 if value < -100 else 100 if value > 100 else value
+
 
 class TelloController:
     """Controller for DJI Tello drone via WiFi UDP"""
 
+    # Re-send an unchanged RC frame after this long so the drone keeps
+    # seeing commands even when the stick values are static
+    RC_KEEPALIVE_INTERVAL = 0.1
+
     def __init__(self, host='192.168.10.1', port=8889, state_port=8890, video_port=11111):
         """
         Initialize Tello controller
@@ -30,9 +58,15 @@ class TelloController:
         self.state_port = state_port
         self.video_port = video_port
 
+        # Command endpoint, built once instead of a fresh tuple per send
+        self._addr = (host, port)
+
         # UDP socket for commands
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.socket.bind(('', 9000))  # Bind to local port for receiving responses
+        # Tello is the only peer, so fix the destination once: send() then
+        # skips the per-packet route/destination work sendto pays
+        self.socket.connect(self._addr)
 
         # State socket
         self.state_socket = None
@@ -43,20 +77,46 @@ class TelloController:
         self.is_connected = False
         self.response = None
         self.response_lock = threading.Lock()
+        # Set by the receiver thread when a response lands, so
+        # send_command can sleep until woken instead of polling
+        self._response_event = threading.Event()
 
-        # Current state data
+        # Current state data: the state thread is the only writer and
+        # publishes each parsed datagram as a fresh dict via one reference
+        # assignment, so readers take snapshots without a lock
         self.state_data = {}
-        self.state_lock = threading.Lock()
 
         # Response receiver thread
         self.receive_thread = None
         self.abort = False
 
+        # Self-pipe used to wake the receiver threads out of their blocking
+        # select on shutdown. The signal byte is deliberately never read, so
+        # every receiver sees the pipe stay readable
+        self._shutdown_r, self._shutdown_w = os.pipe()
+
+        # Last RC frame sent, for duplicate suppression
+        self._last_rc = None
+        self._last_rc_time = 0.0
+
     def connect(self):
         """Initialize connection to Tello with retry logic"""
         try:
             logger.info("Connecting to Tello...")
 
+            # A receiver left over from a failed earlier attempt is still
+            # blocked in select; closing its socket and pipe out from
+            # under it would strand it forever (epoll silently drops
+            # closed fds from the interest set), so wake it through the
+            # pipe and join it before tearing anything down
+            if self.receive_thread and self.receive_thread.is_alive():
+                self.abort = True
+                try:
+                    os.write(self._shutdown_w, b'x')
+                except OSError:
+                    pass
+                self.receive_thread.join(timeout=2)
+
             # Try to close and recreate socket in case it's stuck
             try:
                 if self.socket:
@@ -68,6 +128,13 @@ class TelloController:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             self.socket.bind(('', 9000))
+            self.socket.connect(self._addr)
+
+            # Fresh self-pipe: a previous disconnect leaves its signal byte
+            # behind, which would wake the new receiver threads immediately
+            os.close(self._shutdown_r)
+            os.close(self._shutdown_w)
+            self._shutdown_r, self._shutdown_w = os.pipe()
 
             logger.info("Socket bound to port 9000")
 
@@ -117,10 +184,16 @@ class TelloController:
         self.abort = True
         self.state_running = False
 
+        # Wake the receiver threads out of their blocking select
+        try:
+            os.write(self._shutdown_w, b'x')
+        except OSError:
+            pass
+
         # Send emergency stop to ensure motors are off
         try:
             if self.socket and self.is_connected:
-                self.socket.sendto(b'emergency', (self.host, self.port))
+                self.socket.send(b'emergency')
                 time.sleep(0.1)
         except:
             pass
@@ -149,28 +222,54 @@ class TelloController:
 
     def _receive_response(self):
         """Background thread to receive command responses"""
-        while not self.abort:
-            try:
-                self.socket.settimeout(1.0)
-                response, _ = self.socket.recvfrom(1024)
-                response_str = response.decode('utf-8').strip()
-
-                with self.response_lock:
-                    self.response = response_str
-
-                logger.debug(f"Received: {response_str}")
-
-            except socket.timeout:
-                continue
-            except Exception as e:
-                if not self.abort:
-                    logger.error(f"Error receiving response: {e}")
-                break
+        # Block in select on the socket and the shutdown pipe rather than
+        # waking on a 1-second recv timeout: zero spurious wakeups while
+        # idle, and disconnect interrupts the wait immediately
+        sel = selectors.DefaultSelector()
+        sel.register(self.socket, selectors.EVENT_READ)
+        sel.register(self._shutdown_r, selectors.EVENT_READ)
+        # Buffer allocated once for the thread's lifetime; recv_into fills
+        # it in place instead of recvfrom minting a bytes object (plus an
+        # address tuple) per datagram
+        buf = bytearray(2048)
+        try:
+            while not self.abort:
+                try:
+                    events = sel.select()
+                    if any(key.fileobj is self._shutdown_r for key, _ in events):
+                        break
+                    if not events:
+                        continue
+
+                    n = self.socket.recv_into(buf)
+                    response_str = str(buf[:n], 'utf-8').strip()
+
+                    with self.response_lock:
+                        self.response = response_str
+                    self._response_event.set()
+
+                    logger.debug(f"Received: {response_str}")
+
+                except Exception as e:
+                    if not self.abort:
+                        logger.error(f"Error receiving response: {e}")
+                    break
+        finally:
+            sel.close()
 
     def _start_state_receiver(self):
         """Start thread to receive state data from Tello"""
         try:
             self.state_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            # Let additional consumers (a logger, a second dashboard) bind
+            # the state port alongside us; the kernel then load-balances
+            # datagrams across sockets. Not available on all platforms
+            if hasattr(socket, 'SO_REUSEPORT'):
+                try:
+                    self.state_socket.setsockopt(socket.SOL_SOCKET,
+                                                 socket.SO_REUSEPORT, 1)
+                except OSError:
+                    pass
             self.state_socket.bind(('', self.state_port))
             self.state_running = True
 
@@ -184,30 +283,36 @@ class TelloController:
 
     def _receive_state(self):
         """Background thread to receive state data"""
-        while self.state_running:
-            try:
-                self.state_socket.settimeout(1.0)
-                data, _ = self.state_socket.recvfrom(1024)
-                state_str = data.decode('utf-8').strip()
-
-                # Parse state data
-                state_dict = {}
-                for item in state_str.split(';'):
-                    if ':' in item:
-                        key, value = item.split(':', 1)
-                        try:
-                            state_dict[key] = float(value)
-                        except ValueError:
-                            state_dict[key] = value
-
-                with self.state_lock:
-                    self.state_data = state_dict
-
-            except socket.timeout:
-                continue
-            except Exception as e:
-                if self.state_running:
-                    logger.error(f"Error receiving state: {e}")
+        sel = selectors.DefaultSelector()
+        sel.register(self.state_socket, selectors.EVENT_READ)
+        sel.register(self._shutdown_r, selectors.EVENT_READ)
+        # Reusable buffer + view: the 10 Hz state stream produces zero
+        # per-datagram heap allocation in the recv step, and the regex
+        # scans the filled region of the view without a copy
+        buf = bytearray(2048)
+        view = memoryview(buf)
+        try:
+            while self.state_running:
+                try:
+                    events = sel.select()
+                    if any(key.fileobj is self._shutdown_r for key, _ in events):
+                        break
+                    if not events:
+                        continue
+
+                    n, _ = self.state_socket.recvfrom_into(buf)
+
+                    # One C-level regex pass over the raw bytes replaces the
+                    # decode + split + split + try/except churn per field;
+                    # published with a single (GIL-atomic) reference
+                    # assignment - fresh dict, never mutated afterwards
+                    self.state_data = _parse_state(view[:n])
+
+                except Exception as e:
+                    if self.state_running:
+                        logger.error(f"Error receiving state: {e}")
+        finally:
+            sel.close()
 
     def send_command(self, command, timeout=5):
         """
@@ -225,17 +330,16 @@ class TelloController:
         # Clear previous response
         with self.response_lock:
             self.response = None
+        self._response_event.clear()
 
-        # Send command
-        self.socket.sendto(command.encode('utf-8'), (self.host, self.port))
+        # Send command (socket is connected to the Tello)
+        self.socket.send(command.encode('utf-8'))
 
-        # Wait for response
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        # Block until the receiver thread signals a response (kernel-level
+        # wakeup, no 10 ms polling granularity) or the timeout elapses
+        if self._response_event.wait(timeout):
             with self.response_lock:
-                if self.response:
-                    return self.response
-            time.sleep(0.01)
+                return self.response
 
         logger.warning(f"Command timeout: {command}")
         return None
@@ -281,14 +385,27 @@ class TelloController:
             up_down: Up/down velocity (-100 to 100)
             yaw: Yaw velocity (-100 to 100)
         """
-        # Clamp values to valid range
-        lr = max(-100, min(100, int(left_right)))
-        fb = max(-100, min(100, int(forward_backward)))
-        ud = max(-100, min(100, int(up_down)))
-        y = max(-100, min(100, int(yaw)))
-
-        command = f"rc {lr} {fb} {ud} {y}"
-        self.socket.sendto(command.encode('utf-8'), (self.host, self.port))
+        # Clamp values to valid range: conditional expressions instead of
+        # nested max/min builtin calls (two fewer calls per component)
+        lr = _clip100(left_right)
+        fb = _clip100(forward_backward)
+        ud = _clip100(up_down)
+        y = _clip100(yaw)
+
+        # Suppress duplicates: a hovering pilot sends "rc 0 0 0 0" many
+        # times a second, and each one costs a syscall plus a frame on the
+        # congested 2.4 GHz link. Unchanged values are re-sent only as a
+        # keepalive; the 20 Hz control loop provides the re-send cadence
+        rc = (lr, fb, ud, y)
+        now = time.monotonic()
+        if rc == self._last_rc and now - self._last_rc_time < self.RC_KEEPALIVE_INTERVAL:
+            return
+        self._last_rc = rc
+        self._last_rc_time = now
+
+        # %-formatting on bytes builds the packet in one C-level pass,
+        # skipping the intermediate str and the utf-8 encode
+        self.socket.send(b"rc %d %d %d %d" % rc)
 
     def move(self, direction, distance):
         """
@@ -359,9 +476,12 @@ class TelloController:
             return 0
 
     def get_state(self):
-        """Get current state data"""
-        with self.state_lock:
-            return self.state_data.copy()
+        """Get current state data
+
+        Returns the latest published snapshot; treat it as read-only, since
+        the state thread replaces (never mutates) the dict.
+        """
+        return self.state_data
 
     def get_height(self):
         """Get current height from state data"""
@@ -5,10 +5,16 @@ Real-time EEG data visualization using Flask and SocketIO
 Broadcasts alpha, beta, theta waves to a web dashboard
 """
 
+import gzip
+import hashlib
+import json
 import logging
 import threading
 import time
-from flask import Flask, render_template, jsonify
+from operator import itemgetter
+
+import numpy as np
+from flask import Flask, render_template, jsonify, request, Response
 from flask_socketio import SocketIO, emit
 from flask_cors import CORS
 
@@ -40,24 +46,22 @@ class EEGWebServer:
         # Server state
         self.is_running = False
         self.broadcast_thread = None
+        self._stop_event = threading.Event()
 
-        # Data history for graphs (last 100 data points)
+        # Data history for graphs (last 100 data points), kept in one
+        # preallocated (channels, history) ring: each update is a single
+        # itemgetter pull from the sample plus one fancy-index column
+        # store, instead of 13 hand-written per-channel assignments
         self.max_history = 100
-        self.history = {
-            'timestamps': [],
-            'delta': [],
-            'theta': [],
-            'low_alpha': [],
-            'high_alpha': [],
-            'alpha': [],
-            'low_beta': [],
-            'high_beta': [],
-            'low_gamma': [],
-            'mid_gamma': [],
-            'attention': [],
-            'meditation': [],
-            'signal_quality': []
-        }
+        self._channels = ('delta', 'theta', 'low_alpha', 'high_alpha',
+                          'alpha', 'low_beta', 'high_beta', 'low_gamma',
+                          'mid_gamma', 'attention', 'meditation',
+                          'signal_quality')
+        self._channel_getter = itemgetter(*self._channels)
+        self._hist_array = np.zeros((len(self._channels), self.max_history))
+        self._timestamps = np.zeros(self.max_history)
+        self._hist_idx = 0
+        self._hist_len = 0
 
         # Setup routes
         self._setup_routes()
@@ -76,7 +80,9 @@ class EEGWebServer:
         @self.app.route('/api/status')
         def status():
             """API endpoint for system status"""
-            eeg_data = self.eeg.read_data()
+            # Published snapshots are immutable: handlers serialize the
+            # shared reference instead of paying a dict copy per request
+            eeg_data = self.eeg.latest_data
             return jsonify({
                 'eeg_connected': self.eeg.is_connected,
                 'signal_quality': eeg_data['signal_quality'],
@@ -87,12 +93,28 @@ class EEGWebServer:
         @self.app.route('/api/current')
         def current_data():
             """API endpoint for current EEG data"""
-            return jsonify(self.eeg.read_data())
+            return jsonify(self.eeg.latest_data)
 
         @self.app.route('/api/history')
         def history():
             """API endpoint for historical data"""
-            return jsonify(self.history)
+            payload = json.dumps(self._history_snapshot(),
+                                 separators=(',', ':')).encode('utf-8')
+
+            # Content-addressed ETag: clients polling faster than the
+            # sample rate get a bodyless 304 instead of the full payload
+            etag = hashlib.blake2b(payload, digest_size=8).hexdigest()
+            if etag in request.if_none_match:
+                return Response(status=304, headers={'ETag': etag})
+
+            headers = {'ETag': etag, 'Content-Type': 'application/json'}
+            # The repetitive numeric JSON compresses ~5x; skip tiny
+            # payloads where the gzip header overhead isn't worth it
+            if (len(payload) > 512
+                    and 'gzip' in request.headers.get('Accept-Encoding', '')):
+                payload = gzip.compress(payload, 5)
+                headers['Content-Encoding'] = 'gzip'
+            return Response(payload, headers=headers)
 
     def _setup_socketio_events(self):
         """Setup SocketIO event handlers"""
@@ -111,54 +133,111 @@ class EEGWebServer:
         @self.socketio.on('request_data')
         def handle_request_data():
             """Handle data request from client"""
-            eeg_data = self.eeg.read_data()
-            emit('eeg_data', eeg_data)
+            emit('eeg_data', self.eeg.latest_data)
 
     def _update_history(self, data):
         """Update data history for graphs"""
-        current_time = time.time()
-
-        # Add new data
-        self.history['timestamps'].append(current_time)
-        self.history['delta'].append(data['delta'])
-        self.history['theta'].append(data['theta'])
-        self.history['low_alpha'].append(data['low_alpha'])
-        self.history['high_alpha'].append(data['high_alpha'])
-        self.history['alpha'].append(data['alpha'])
-        self.history['low_beta'].append(data['low_beta'])
-        self.history['high_beta'].append(data['high_beta'])
-        self.history['low_gamma'].append(data['low_gamma'])
-        self.history['mid_gamma'].append(data['mid_gamma'])
-        self.history['attention'].append(data['attention'])
-        self.history['meditation'].append(data['meditation'])
-        self.history['signal_quality'].append(data['signal_quality'])
-
-        # Remove old data if exceeding max history
-        if len(self.history['timestamps']) > self.max_history:
-            for key in self.history:
-                self.history[key] = self.history[key][-self.max_history:]
+        idx = self._hist_idx
+
+        # One C-level itemgetter pull of all channels from the sample and
+        # one vectorized column store; the oldest column is overwritten in
+        # place once the ring is full
+        self._hist_array[:, idx] = self._channel_getter(data)
+        self._timestamps[idx] = time.time()
+
+        self._hist_idx = (idx + 1) % self.max_history
+        if self._hist_len < self.max_history:
+            self._hist_len += 1
+
+    def _history_snapshot(self):
+        """Unwrap the history ring into chronological lists for JSON"""
+        idx = self._hist_idx
+        n = self._hist_len
+        if n < self.max_history:
+            snapshot = {'timestamps': self._timestamps[:n].tolist()}
+            rows = self._hist_array[:, :n]
+        else:
+            snapshot = {'timestamps': np.concatenate(
+                (self._timestamps[idx:], self._timestamps[:idx])).tolist()}
+            # One roll realigns every channel to chronological order
+            rows = np.roll(self._hist_array, -idx, axis=1)
+        for key, row in zip(self._channels, rows):
+            snapshot[key] = row.tolist()
+        return snapshot
 
     def _broadcast_loop(self):
         """Background thread for broadcasting EEG data"""
         logger.info("Starting EEG data broadcast loop...")
 
+        period = 1.0 / self.config.WEB_UPDATE_RATE
+        batch_size = self.config.WEB_BATCH_SIZE
+        # Latency bound: a partial batch never waits longer than N/rate
+        flush_deadline = batch_size * period
+        # Hoist the per-tick lookups to locals: bound methods are built
+        # once here instead of on every iteration of a loop that runs for
+        # the whole flight
+        stop_wait = self._stop_event.wait
+        emit = self.socketio.emit
+        update_history = self._update_history
+        eeg = self.eeg
+        monotonic = time.monotonic
+        perf = time.perf_counter
+
+        batch = []
+        batch_start = 0.0
+        last_broadcast = None
+
+        # Schedule ticks against absolute deadlines instead of sleeping a
+        # fixed period after the work: the per-tick processing time no
+        # longer accumulates as drift, so the broadcast rate stays pinned
+        # to WEB_UPDATE_RATE over a whole flight
+        next_tick = perf() + period
+
         while self.is_running:
             try:
-                # Read current EEG data
-                eeg_data = self.eeg.read_data()
+                # Published snapshots are immutable, so share the reference
+                # instead of copying the dict on every broadcast tick; the
+                # dashboard never steals copy time from the control loop
+                eeg_data = eeg.latest_data
 
                 # Update history
-                self._update_history(eeg_data)
-
-                # Broadcast to all connected clients
-                self.socketio.emit('eeg_data', eeg_data)
-
-                # Sleep for update interval
-                time.sleep(1.0 / self.config.WEB_UPDATE_RATE)
+                update_history(eeg_data)
+
+                # Accumulate samples and broadcast one batched message:
+                # a single serialize + websocket frame per N samples.
+                # Snapshot swaps make change detection an identity check -
+                # the same reference means no packet arrived since the last
+                # tick, so there is nothing new worth serializing
+                if eeg_data is not last_broadcast:
+                    if not batch:
+                        batch_start = monotonic()
+                    batch.append(eeg_data)
+                    last_broadcast = eeg_data
+
+                if batch and (len(batch) >= batch_size
+                              or monotonic() - batch_start >= flush_deadline):
+                    emit('eeg_data_batch', batch)
+                    batch = []
+
+                # Wait until the next deadline, waking early on stop(). If
+                # a tick ran long (slow emit, GC pause), resynchronize to
+                # now rather than firing a burst of catch-up ticks
+                delay = next_tick - perf()
+                if delay > 0:
+                    if stop_wait(delay):
+                        break
+                    next_tick += period
+                else:
+                    next_tick = perf() + period
 
             except Exception as e:
                 logger.error(f"Error in broadcast loop: {e}")
-                time.sleep(0.1)
+                stop_wait(0.1)
+                next_tick = perf() + period
+
+        # Flush whatever was buffered when the loop ended
+        if batch:
+            self.socketio.emit('eeg_data_batch', batch)
 
     def start(self):
         """Start the web server"""
@@ -166,10 +245,12 @@ class EEGWebServer:
         logger.info(f"Dashboard URL: http://{self.config.WEB_HOST}:{self.config.WEB_PORT}")
         logger.info(f"Access from network: http://<raspberry-pi-ip>:{self.config.WEB_PORT}")
 
-        # Start broadcast thread
+        # Start broadcast task through SocketIO so it lands on whatever
+        # concurrency model the server runs under (a daemon thread with
+        # async_mode='threading', a green thread under eventlet/gevent)
         self.is_running = True
-        self.broadcast_thread = threading.Thread(target=self._broadcast_loop, daemon=True)
-        self.broadcast_thread.start()
+        self._stop_event.clear()
+        self.broadcast_thread = self.socketio.start_background_task(self._broadcast_loop)
 
         # Start Flask server
         self.socketio.run(
@@ -185,6 +266,7 @@ class EEGWebServer:
         """Stop the web server"""
         logger.info("Stopping EEG web server...")
         self.is_running = False
+        self._stop_event.set()
         if self.broadcast_thread:
             self.broadcast_thread.join(timeout=2)
 